@@ -1,59 +1,45 @@
-import os
 import sys
 
 import typer
 
-from bondi import output
-from bondi.cli import config
-from bondi.cli.admin import builtin_images, users
-from bondi.cli.user import (
-    crashes,
-    fuzzers,
-    images,
-    integrations,
-    projects,
-    revisions,
-    statistics,
-    pools,
-)
-from bondi.defaults import DEFAULTS_DIR
-from bondi.errors import BadParameterError, BondiError, BondiValidationError
+from bondi.lazy import LazyTyperGroup
 from bondi.models import AppContext, OutputMode, Verbosity
-from bondi.util import APP_DIR
 
 ########################################
-# Admin CLI
+# Common options
 ########################################
 
-app_admin = typer.Typer(
-    name="admin",
-    help="Bondifuzz admin CLI. Use with caution",
-    short_help="Admin CLI",
-)
-
-app_admin.add_typer(builtin_images.app)
-app_admin.add_typer(users.app)
+_VERBOSITY_VALUES = tuple(e.value for e in Verbosity)
+_VERBOSITY_METAVAR = f"[{'|'.join(_VERBOSITY_VALUES)}]"
+_OUTPUT_MODE_VALUES = tuple(e.value for e in OutputMode)
+_OUTPUT_MODE_METAVAR = f"[{'|'.join(_OUTPUT_MODE_VALUES)}]"
 
 ########################################
 # Client CLI
 ########################################
 
+
+class BondiGroup(LazyTyperGroup):
+    lazy_commands = {
+        "admin": ("bondi.cli.admin", "Admin CLI"),
+        "images": ("bondi.cli.user.images", "User's agent images"),
+        "projects": ("bondi.cli.user.projects", "User's projects"),
+        "pools": ("bondi.cli.user.pools", "User's pools"),
+        "integrations": ("bondi.cli.user.integrations", "Project integrations"),
+        "fuzzers": ("bondi.cli.user.fuzzers", "User's fuzzers"),
+        "statistics": ("bondi.cli.user.statistics", "Fuzzer statistics"),
+        "revisions": ("bondi.cli.user.revisions", "Fuzzer revisions (versions)"),
+        "crashes": ("bondi.cli.user.crashes", "Found crashes"),
+        "config": ("bondi.cli.config", "Manage configuration"),
+    }
+
+
 app = typer.Typer(
     name="bondi",
+    cls=BondiGroup,
     help="Bondifuzz command line interface implemented in python",
 )
 
-app.add_typer(app_admin)
-app.add_typer(images.app)
-app.add_typer(projects.app)
-app.add_typer(pools.app)
-app.add_typer(integrations.app)
-app.add_typer(fuzzers.app)
-app.add_typer(statistics.app)
-app.add_typer(revisions.app)
-app.add_typer(crashes.app)
-app.add_typer(config.app)
-
 
 @app.callback()
 def common_options(
@@ -63,16 +49,16 @@ def common_options(
         "-v",
         "--verbosity",
         help="Enable logging output. Usually used for debugging",
-        autocompletion=lambda: [e.value for e in Verbosity],
-        metavar=f"[{'|'.join([e.value for e in Verbosity])}]",
+        autocompletion=lambda: _VERBOSITY_VALUES,
+        metavar=_VERBOSITY_METAVAR,
     ),
     output_mode: str = typer.Option(
         OutputMode.human.value,
         "-o",
         "--output-mode",
         help="Choose an output mode. Human-readable by default",
-        autocompletion=lambda: [e.value for e in OutputMode],
-        metavar=f"[{'|'.join([e.value for e in OutputMode])}]",
+        autocompletion=lambda: _OUTPUT_MODE_VALUES,
+        metavar=_OUTPUT_MODE_METAVAR,
     ),
     silent: bool = typer.Option(
         False,
@@ -91,9 +77,6 @@ def common_options(
         help="If set, prompts required values interactively. Otherwise, exits with error",
     ),
 ):
-    os.makedirs(APP_DIR, exist_ok=True)
-    os.makedirs(DEFAULTS_DIR, exist_ok=True)
-
     ctx.obj = AppContext(
         verbosity=verbosity,
         output_mode=output_mode,
@@ -106,13 +89,25 @@ def common_options(
 def main():
     try:
         app()
-    except BondiValidationError as e:
-        output.validation_errors(e)
-    except BadParameterError as e:
-        output.bad_parameters(e)
-        sys.exit(1)
-    except BondiError as e:
-        output.error(str(e))
-        sys.exit(1)
+    except Exception as e:
+
+        #
+        # Error reporting is not needed on success path.
+        # Import it only when something went wrong
+        #
+
+        from bondi import output
+        from bondi.errors import BadParameterError, BondiError, BondiValidationError
+
+        if isinstance(e, BondiValidationError):
+            output.validation_errors(e)
+        elif isinstance(e, BadParameterError):
+            output.bad_parameters(e)
+            sys.exit(1)
+        elif isinstance(e, BondiError):
+            output.error(str(e))
+            sys.exit(1)
+        else:
+            raise
     else:
         sys.exit(0)
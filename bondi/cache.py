@@ -0,0 +1,60 @@
+import json
+import os
+import shutil
+import time
+from contextlib import suppress
+from typing import Any, Optional
+
+from .util import APP_NAME, ensure_dir
+
+_XDG_CACHE_HOME = os.environ.get("XDG_CACHE_HOME") or "~/.cache"
+CACHE_DIR = os.path.join(os.path.expanduser(_XDG_CACHE_HOME), APP_NAME)
+
+
+def get_cache_path(name: str):
+    return os.path.join(CACHE_DIR, f"{name}.json")
+
+
+def load_cached(name: str, ttl: float) -> Optional[Any]:
+
+    """Returns cached data or None, if it's missing or older than ttl seconds"""
+
+    filepath = get_cache_path(name)
+
+    try:
+        if time.time() - os.stat(filepath).st_mtime > ttl:
+            return None
+
+        with open(filepath, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached(name: str, data: Any):
+
+    """
+    Replaces cached data atomically, so concurrent
+    readers never see partially written file.
+    Cache is optional, so write errors are ignored
+    """
+
+    filepath = get_cache_path(name)
+    tmp_filepath = f"{filepath}.{os.getpid()}.tmp"
+
+    with suppress(OSError):
+        ensure_dir(CACHE_DIR)
+        with open(tmp_filepath, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        os.replace(tmp_filepath, filepath)
+
+
+def remove_cached(name: str):
+    with suppress(FileNotFoundError):
+        os.remove(get_cache_path(name))
+
+
+def clear_cache():
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
@@ -1,4 +1,5 @@
-from typing import Any, Callable, Optional
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from click import MissingParameter
 from typer import Context
@@ -26,8 +27,12 @@ class OptionCallback:
     two callbacks: validation and default value loader
     """
 
+    __slots__ = ("validation_fn", "default_val_fn", "required")
+
     # Make type annotations the same as
-    # those in __call__ method
+    # those in __call__ method. Typer reads them
+    # from the instance with get_type_hints(), so they
+    # must stay a class attribute (not affected by slots)
 
     __annotations__ = {
         "ctx": Context,
@@ -55,42 +60,49 @@ class OptionCallback:
         if ctx.resilient_parsing:
             return value
 
-        app_ctx: AppContext = ctx.obj
-        prompt_required = app_ctx.prompt
+        validation_fn = self.validation_fn
 
         #
-        # If value is not set, try to use
-        # default value function to load it
+        # Value is set in command line (most common case).
+        # Nothing to load or prompt, just validate it
         #
 
-        if value is None:
-            if self.default_val_fn:
-                value = self.default_val_fn()
+        if value is not None:
+            if validation_fn is not None:
+                value = validation_fn(value)
+            return param.type_cast_value(ctx, value)
+
+        default_val_fn = self.default_val_fn
+        required = self.required
 
         #
-        # If value is not set, prompt it, if allowed
+        # If value is not set, try to use
+        # default value function to load it
         #
 
-        if value is None:
-            if self.required and prompt_required:
-                param_name: str = param.name
-                param.prompt = beautify(param_name)
-                value = param.prompt_for_value(ctx)
+        if default_val_fn is not None:
+            value = default_val_fn()
 
         #
-        # If value is still not set
-        # and required, raise exception
+        # If value is still not set, prompt it, if allowed.
+        # Otherwise, raise exception if value is required
         #
 
-        if value is None and self.required:
-            raise MissingParameter(param=param)
+        if value is None and required:
+            app_ctx: AppContext = ctx.obj
+            if app_ctx.prompt:
+                param.prompt = beautify(param.name)
+                value = param.prompt_for_value(ctx)
+
+            if value is None:
+                raise MissingParameter(param=param)
 
         #
         # Perform validation, if needed
         #
 
-        if self.validation_fn:
-            value = self.validation_fn(value)
+        if validation_fn is not None:
+            value = validation_fn(value)
 
         return param.type_cast_value(ctx, value)
 
@@ -103,60 +115,49 @@ class OptionCallback:
         return self.invoke(ctx, param, value)
 
 
-class StringCallback(OptionCallback):
-    def __init__(self, required: bool = True) -> None:
-        super().__init__(validators.string, None, required)
+@functools.lru_cache(maxsize=2)
+def string_cb(required: bool = True):
+    return OptionCallback(validators.string, None, required)
 
 
-class PositiveIntCallback(OptionCallback):
-    def __init__(self, required: bool = True) -> None:
-        super().__init__(validators.positive_int, None, required)
+@functools.lru_cache(maxsize=2)
+def positive_int_cb(required: bool = True):
+    return OptionCallback(validators.positive_int, None, required)
 
 
-class UrlCallback(OptionCallback):
-    def __init__(self, required: bool = True) -> None:
-        super().__init__(validators.url, None, required)
+@functools.lru_cache(maxsize=2)
+def url_cb(required: bool = True):
+    return OptionCallback(validators.url, None, required)
 
 
-class EmailCallback(OptionCallback):
-    def __init__(self, required: bool = True) -> None:
-        super().__init__(validators.email, None, required)
+@functools.lru_cache(maxsize=2)
+def email_cb(required: bool = True):
+    return OptionCallback(validators.email, None, required)
 
 
-class DefaultUserCallback(OptionCallback):
-    def __init__(self, required: bool = False) -> None:
-        super().__init__(
-            validation_fn=validators.string,
-            default_val_fn=load_default_user,
-            required=required,
-        )
+@functools.lru_cache(maxsize=2)
+def default_user_cb(required: bool = False):
+    return OptionCallback(validators.string, load_default_user, required)
 
 
-class DefaultProjectCallback(OptionCallback):
-    def __init__(self, required: bool = True) -> None:
-        super().__init__(
-            validation_fn=validators.string,
-            default_val_fn=load_default_project,
-            required=required,
-        )
+@functools.lru_cache(maxsize=2)
+def default_project_cb(required: bool = True):
+    return OptionCallback(validators.string, load_default_project, required)
 
 
-class DefaultFuzzerCallback(OptionCallback):
-    def __init__(self, required: bool = True) -> None:
-        super().__init__(
-            validation_fn=validators.string,
-            default_val_fn=load_default_fuzzer,
-            required=required,
-        )
+@functools.lru_cache(maxsize=2)
+def default_fuzzer_cb(required: bool = True):
+    return OptionCallback(validators.string, load_default_fuzzer, required)
 
 
-class DefaultRevisionCallback(OptionCallback):
-    def __init__(self, required: bool = True) -> None:
-        super().__init__(
-            validation_fn=validators.string,
-            default_val_fn=load_default_revision,
-            required=required,
-        )
+@functools.lru_cache(maxsize=2)
+def default_revision_cb(required: bool = True):
+    return OptionCallback(validators.string, load_default_revision, required)
+
+
+@functools.lru_cache(maxsize=None)
+def _params_for(fn: Callable[..., Any]):
+    return get_params_from_function(fn)
 
 
 class CallbackInvoker:
@@ -168,17 +169,33 @@ class CallbackInvoker:
     e.g. '-t type1 -p1 type1-param | -t type2 -p2 type2-param'
     """
 
+    # Click parameters built from command handler signature.
+    # Key is (command handler function, option name)
+
+    _click_params: Dict[Tuple[Callable[..., Any], str], TyperOption] = {}
+
     def __init__(self, ctx: Context) -> None:
-        self.params = get_params_from_function(ctx.command.callback)
+        self.callback = ctx.command.callback
+        self.params = _params_for(self.callback)
         self.ctx = ctx
 
+    def _get_click_param(self, option_name: str):
+
+        key = (self.callback, option_name)
+        param = self._click_params.get(key)
+
+        if param is None:
+            param, _ = get_click_param(self.params[option_name])
+            assert isinstance(param, TyperOption)
+            self._click_params[key] = param
+
+        return param
+
     def invoke_callback_for_option(
         self,
         option_name: str,
         callback: OptionCallback,
     ):
-        param, _ = get_click_param(self.params[option_name])
-        assert isinstance(param, TyperOption)
-
+        param = self._get_click_param(option_name)
         default = param.get_default(self.ctx)
         return callback.invoke(self.ctx, param, default)
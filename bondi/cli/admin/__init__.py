@@ -0,0 +1,21 @@
+import typer
+
+from bondi.lazy import LazyTyperGroup
+
+
+class AdminGroup(LazyTyperGroup):
+    lazy_commands = {
+        "images": (
+            "bondi.cli.admin.builtin_images",
+            "Manage agent docker images (built-in)",
+        ),
+        "users": ("bondi.cli.admin.users", "Manage users"),
+    }
+
+
+app = typer.Typer(
+    name="admin",
+    cls=AdminGroup,
+    help="Bondifuzz admin CLI. Use with caution",
+    short_help="Admin CLI",
+)
@@ -1,15 +1,16 @@
-import itertools
-from typing import Dict, List, Optional
+from __future__ import annotations
+
+import functools
+from collections import defaultdict
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 import typer
-from pydantic import BaseModel
 
 from bondi import output, validators
-from bondi.callback import OptionCallback
-from bondi.client import AutologinClient
+from bondi.callback import string_cb
 from bondi.constants import C_NO_PARAMS_SET
-from bondi.helper import paginate, parse_response, parse_response_no_model
-from bondi.meta import list_fuzzer_configurations
 from bondi.models import (
     AppContext,
     FuzzerLang,
@@ -18,7 +19,10 @@ from bondi.models import (
     ImageType,
     UpdateResponseModel,
 )
-from bondi.util import make_option, wrap_autocompletion_errors
+from bondi.util import make_option, prefix_matches, wrap_autocompletion_errors
+
+if TYPE_CHECKING:
+    from bondi.client import AutologinClient
 
 ########################################
 # App
@@ -42,18 +46,40 @@ URL_REGISTRY = "cr.yandex/<registry-id>"
 ########################################
 
 
-class CreateImageResponseModel(BaseModel):
+@dataclass
+class CreateImageResponseModel:
+
+    """Built from trusted server response without validation"""
+
+    __slots__ = ("id", "name", "status")
+
     id: str
     name: str
     status: ImageStatus
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            status=ImageStatus(data["status"]),
+        )
+
     def display_dict(self):
-        data = self.dict()
-        data["status"] = self.status.value
-        return data
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status.value,
+        }
+
+
+@dataclass
+class GetImageResponseModel:
+
+    """Built from trusted server response without validation"""
 
+    __slots__ = ("id", "name", "description", "type", "status", "engine", "lang")
 
-class GetImageResponseModel(BaseModel):
     id: str
     name: str
     description: str
@@ -62,38 +88,119 @@ class GetImageResponseModel(BaseModel):
     engine: FuzzingEngine
     lang: FuzzerLang
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            description=data["description"],
+            type=ImageType(data["type"]),
+            status=ImageStatus(data["status"]),
+            engine=FuzzingEngine(data["engine"]),
+            lang=FuzzerLang(data["lang"]),
+        )
+
     def display_dict(self):
-        data = self.dict()
-        data["type"] = self.type.value
-        data["status"] = self.status.value
-        data["engine"] = self.engine.value
-        data["lang"] = self.lang.value
-        return data
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": self.description,
+            "type": self.type.value,
+            "status": self.status.value,
+            "engine": self.engine.value,
+            "lang": self.lang.value,
+        }
+
+
+########################################
+# Columns
+########################################
+
+_CONFIGURATIONS_COLUMNS = (
+    ("cpp", "C++"),
+    ("go", "Go"),
+    ("rust", "Rust"),
+    ("python", "Python"),
+)
+
+_CREATE_COLUMNS = (
+    ("id", "ID"),
+    ("name", "Image name"),
+    ("status", "Status"),
+)
 
+_GET_COLUMNS = (
+    ("id", "ID"),
+    ("name", "Image name"),
+    ("description", "Description"),
+    ("status", "Status"),
+    ("engine", "Fuzzing engine"),
+    ("lang", "Target language"),
+)
+
+_LIST_COLUMNS = (
+    ("id", "ID", 0.1),
+    ("name", "Image name", 0.2),
+    ("description", "Description", 0.5),
+    ("status", "Status", 0.1),
+    ("engine", "Engine", 0.1),
+    ("lang", "Lang", 0.1),
+)
+
+_UPDATE_COLUMNS = MappingProxyType(
+    {
+        "name": "Image name",
+        "description": "Description",
+    }
+)
 
 ########################################
 # Utils
 ########################################
 
 
-def send_list_images(client: AutologinClient):
+def send_list_images(client: AutologinClient) -> Iterator[Dict[str, str]]:
+
+    from bondi.helper import paginate
 
-    data = []
     ResponseModel = GetImageResponseModel
 
-    image: ResponseModel
     for image in paginate(client, URL_IMAGES, ResponseModel):
-        data.append(image.display_dict())
-
-    return data
+        yield image.display_dict()
 
 
 ########################################
 # Autocompletion
 ########################################
 
-FUZZING_ENGINES = [e.value for e in FuzzingEngine]
-FUZZER_LANGS = [l.value for l in FuzzerLang]
+
+FUZZING_ENGINES = tuple(e.value for e in FuzzingEngine)
+FUZZER_LANGS = tuple(l.value for l in FuzzerLang)
+_FUZZING_ENGINES_METAVAR = f"[{'|'.join(FUZZING_ENGINES)}]"
+_FUZZER_LANGS_METAVAR = f"[{'|'.join(FUZZER_LANGS)}]"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_configurations():
+
+    from bondi.client import get_shared_client
+    from bondi.meta import list_fuzzer_configurations
+
+    client = get_shared_client()
+    configurations = list_fuzzer_configurations(client)
+
+    configurations_dict = configurations.dict(by_alias=True)
+
+    inverted: Dict[str, List[str]] = defaultdict(list)
+    for lang, engines in configurations_dict.items():
+        for engine in engines:
+            inverted[engine].append(lang)
+
+    # Sorted lists allow to find completions with binary search
+    lang_to_engines = {k: sorted(v) for k, v in configurations_dict.items()}
+    engine_to_langs = {k: sorted(v) for k, v in inverted.items()}
+
+    return lang_to_engines, engine_to_langs
 
 
 @wrap_autocompletion_errors
@@ -103,13 +210,8 @@ def get_engine_by_lang(ctx: typer.Context, opt_engine: str):
     if opt_lang is None or opt_lang not in FUZZER_LANGS:
         return FUZZING_ENGINES
 
-    with AutologinClient() as client:
-        configurations = list_fuzzer_configurations(client)
-
-    configurations_dict = configurations.dict(by_alias=True)
-    engines: List[str] = configurations_dict[opt_lang]
-
-    return list(filter(lambda e: e.startswith(opt_engine), engines))
+    lang_to_engines, _ = _load_configurations()
+    return prefix_matches(lang_to_engines.get(opt_lang, ()), opt_engine)
 
 
 @wrap_autocompletion_errors
@@ -119,32 +221,26 @@ def get_lang_by_engine(ctx: typer.Context, opt_lang: str):
     if opt_engine is None or opt_engine not in FUZZING_ENGINES:
         return FUZZER_LANGS
 
-    with AutologinClient() as client:
-        configurations = list_fuzzer_configurations(client)
-
-    configurations_dict = configurations.dict(by_alias=True)
-    configurations_engines = configurations_dict.values()
+    _, engine_to_langs = _load_configurations()
+    return prefix_matches(engine_to_langs.get(opt_engine, ()), opt_lang)
 
-    inverted: Dict[str, List[str]] = {}
-    for engine in set(itertools.chain(*configurations_engines)):
-        inverted[engine] = list()
 
-    for lang, engines in configurations_dict.items():
-        for engine in engines:
-            if engine in inverted:
-                inverted[engine].append(lang)
+@wrap_autocompletion_errors
+def complete_image_id(incomplete: str):
 
-    langs: List[str] = inverted[opt_engine]
-    return list(filter(lambda l: l.startswith(opt_lang), langs))
+    from bondi.client import get_shared_client
+    from bondi.helper import paginate
 
+    #
+    # Server does not guarantee any order of images,
+    # so all pages must be checked. Match on models
+    # directly to skip building display dicts
+    #
 
-@wrap_autocompletion_errors
-def complete_image_id(incomplete: str):
-    with AutologinClient() as client:
-        for image in send_list_images(client):
-            image_id: str = image["id"]
-            if image_id.startswith(incomplete):
-                yield image_id, image["name"]
+    client = get_shared_client()
+    for image in paginate(client, URL_IMAGES, GetImageResponseModel):
+        if image.id.startswith(incomplete):
+            yield image.id, image.name
 
 
 ########################################
@@ -159,20 +255,15 @@ def complete_image_id(incomplete: str):
 )
 def show_configurations(ctx: typer.Context):
 
+    from bondi.meta import list_fuzzer_configurations
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
 
-    with AutologinClient() as client:
-        data = list_fuzzer_configurations(client)
+    client = app_ctx.client
+    data = list_fuzzer_configurations(client)
 
-    columns = [
-        ("cpp", "C++"),
-        ("go", "Go"),
-        ("rust", "Rust"),
-        ("python", "Python"),
-    ]
-
-    output.dict_data(data.display_dict(), columns, output_mode)
+    output.dict_data(data.display_dict(), _CONFIGURATIONS_COLUMNS, output_mode)
 
 
 ########################################
@@ -211,7 +302,7 @@ def create_builtin_image(
         prompt=True,
         prompt_required=False,
         autocompletion=get_lang_by_engine,
-        metavar=f"[{'|'.join(FUZZER_LANGS)}]",
+        metavar=_FUZZER_LANGS_METAVAR,
         help="Target programming language",
     ),
     engine: FuzzingEngine = typer.Option(
@@ -221,10 +312,12 @@ def create_builtin_image(
         prompt=True,
         prompt_required=False,
         autocompletion=get_engine_by_lang,
-        metavar=f"[{'|'.join(FUZZING_ENGINES)}]",
+        metavar=_FUZZING_ENGINES_METAVAR,
         help="Target fuzzing engine",
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = CreateImageResponseModel
@@ -236,19 +329,13 @@ def create_builtin_image(
         "lang": lang,
     }
 
-    with AutologinClient() as client:
-        response = client.post(URL_IMAGES, json=json_data)
-        data: ResponseModel = parse_response(response, ResponseModel)
-
-    columns = [
-        ("id", "ID"),
-        ("name", "Image name"),
-        ("status", "Status"),
-    ]
+    client = app_ctx.client
+    response = client.post(URL_IMAGES, json=json_data)
+    data: ResponseModel = parse_response(response, ResponseModel)
 
     output.message("Don't forget to push docker image:", output_mode)
     output.message(f"$ docker push {URL_REGISTRY}/agents/{data.id}", output_mode)
-    output.dict_data(data.display_dict(), columns, output_mode)
+    output.dict_data(data.display_dict(), _CREATE_COLUMNS, output_mode)
 
 
 ########################################
@@ -269,24 +356,17 @@ def get_builtin_image(
         help="Image name or id",
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = GetImageResponseModel
 
-    with AutologinClient() as client:
-        response = client.get(f"{URL_IMAGES}/{image_id}")
-        data: ResponseModel = parse_response(response, ResponseModel)
-
-    columns = [
-        ("id", "ID"),
-        ("name", "Image name"),
-        ("description", "Description"),
-        ("status", "Status"),
-        ("engine", "Fuzzing engine"),
-        ("lang", "Target language"),
-    ]
+    client = app_ctx.client
+    response = client.get(f"{URL_IMAGES}/{image_id}")
+    data: ResponseModel = parse_response(response, ResponseModel)
 
-    output.dict_data(data.display_dict(), columns, output_mode)
+    output.dict_data(data.display_dict(), _GET_COLUMNS, output_mode)
 
 
 ########################################
@@ -300,21 +380,12 @@ def get_builtin_image(
 )
 def list_builtin_images(ctx: typer.Context):
 
-    columns = [
-        ("id", "ID", 0.1),
-        ("name", "Image name", 0.2),
-        ("description", "Description", 0.5),
-        ("status", "Status", 0.1),
-        ("engine", "Engine", 0.1),
-        ("lang", "Lang", 0.1),
-    ]
-
-    with AutologinClient() as client:
-        data = send_list_images(client)
-
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
-    output.list_data(data, columns, output_mode)
+
+    client = app_ctx.client
+    data = send_list_images(client)
+    output.list_data(data, _LIST_COLUMNS, output_mode)
 
 
 ########################################
@@ -338,48 +409,39 @@ def update_builtin_image(
         None,
         "-n",
         "--name",
-        callback=OptionCallback(
-            validation_fn=validators.string,
-            required=False,
-        ),
+        callback=string_cb(required=False),
         help="New image name",
     ),
     description: Optional[str] = typer.Option(
         None,
         "-d",
         "--description",
-        callback=OptionCallback(
-            validation_fn=validators.string,
-            required=False,
-        ),
+        callback=string_cb(required=False),
         help="New image description",
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = UpdateResponseModel
 
-    json_data = {
-        "name": name,
-        "description": description,
-    }
-
-    if all(v is None for v in json_data.values()):
-        param_names = "|".join(map(make_option, json_data.keys()))
+    if name is None and description is None:
+        param_names = "|".join(map(make_option, ("name", "description")))
         output.error(f"{C_NO_PARAMS_SET}: [{param_names}]")
         raise typer.Exit(code=1)
 
-    with AutologinClient() as client:
-        url = f"{URL_IMAGES}/{image_id}"
-        response = client.patch(url, json=json_data)
-        data: ResponseModel = parse_response(response, ResponseModel)
-
-    columns = {
-        "name": "Image name",
-        "description": "Description",
+    # Send only fields to be changed
+    json_data = {
+        k: v for k, v in (("name", name), ("description", description)) if v is not None
     }
 
-    output.diff_data(data.old, data.new, columns, output_mode)
+    client = app_ctx.client
+    url = f"{URL_IMAGES}/{image_id}"
+    response = client.patch(url, json=json_data)
+    data: ResponseModel = parse_response(response, ResponseModel)
+
+    output.diff_data(data.old, data.new, _UPDATE_COLUMNS, output_mode)
 
 
 ########################################
@@ -400,14 +462,16 @@ def delete_builtin_image(
         help="Image name or id",
     ),
 ):
+    from bondi.helper import parse_response_no_model
+
     app_ctx: AppContext = ctx.obj
     if not app_ctx.auto_approve:
         msg = "Do you really want to delete this image?"
         typer.confirm(msg, abort=True)
 
-    with AutologinClient() as client:
-        response = client.delete(f"{URL_IMAGES}/{image_id}")
-        parse_response_no_model(response)
+    client = app_ctx.client
+    response = client.delete(f"{URL_IMAGES}/{image_id}")
+    parse_response_no_model(response)
 
     output.message("Don't forget to delete docker image from registry")
     output.success("Image deleted successfully")
@@ -1,23 +1,41 @@
-from datetime import datetime
-from typing import List, Optional
+from __future__ import annotations
+
+import functools
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+try:
+    from typing import TypedDict
+except ImportError:  # python 3.7
+    from typing_extensions import TypedDict
 
 import typer
-from pydantic import BaseModel, validator
 
 from bondi import output, validators
-from bondi.client import AutologinClient
+from bondi.cache import load_cached, remove_cached, save_cached
 from bondi.constants import C_NO_PARAMS_SET, C_WARN_UNRECOVERABLE
-from bondi.defaults import load_default_user, remove_default_user, save_default_user
+from bondi.defaults import (
+    has_default_user,
+    load_default_user,
+    remove_default_user,
+    save_default_user,
+)
 from bondi.errors import InternalError, ServerSideValidationError
-from bondi.helper import paginate, parse_response, parse_response_no_model
 from bondi.models import AppContext, DeleteActions, UpdateResponseModel
 from bondi.util import (
     is_identifier,
     make_option,
+    prefix_matches,
     utc_to_local,
     wrap_autocompletion_errors,
 )
 
+if TYPE_CHECKING:
+    from httpx import Response
+
+    from bondi.client import AutologinClient
+
 ########################################
 # App
 ########################################
@@ -29,13 +47,25 @@ app = typer.Typer(name="users", help="Manage users")
 ########################################
 
 URL_USERS = "/api/v1/admin/users"
+USERS_PAGE_SIZE = 100
+
+########################################
+# Cache
+########################################
+
+USER_NAMES_CACHE = "users_autocomplete"
+USER_NAMES_CACHE_TTL = 60  # seconds
+
+USER_IDS_CACHE = "user_ids"
+USER_IDS_CACHE_TTL = 300  # seconds
+USER_IDS_CACHE_SIZE = 128
 
 ########################################
 # Models
 ########################################
 
 
-class CreateUserResponseModel(BaseModel):
+class CreateUserResponseModel(TypedDict):
     id: str
     name: str
     is_admin: bool
@@ -43,7 +73,7 @@ class CreateUserResponseModel(BaseModel):
     is_disabled: bool
 
 
-class GetUserResponseModel(BaseModel):
+class GetUserResponseModel(TypedDict):
     id: str
     name: str
     display_name: str
@@ -52,29 +82,165 @@ class GetUserResponseModel(BaseModel):
     is_disabled: bool
     is_admin: bool
     is_system: bool
-    erasure_date: Optional[datetime]
+    erasure_date: Optional[str]
+
+
+_CREATE_FIELDS = tuple(CreateUserResponseModel.__annotations__)
+_GET_FIELDS = tuple(GetUserResponseModel.__annotations__)
+
+
+def _local_date(date: Optional[str]):
+
+    if date is None:
+        return None
+
+    from pydantic.datetime_parse import parse_datetime
+
+    return utc_to_local(parse_datetime(date))
+
+
+def create_user_dict(user: CreateUserResponseModel):
+
+    """Only declared fields are shown, extra ones are dropped"""
+
+    return {k: user[k] for k in _CREATE_FIELDS}
+
+
+def user_dict(user: GetUserResponseModel):
+
+    """Only declared fields are shown, extra ones are dropped"""
 
-    @validator("erasure_date")
-    def utc_to_local(date: datetime):
-        return utc_to_local(date)
+    data = {k: user[k] for k in _GET_FIELDS}
+    data["erasure_date"] = _local_date(user["erasure_date"])
+    return data
+
+
+def user_display_dict(user: GetUserResponseModel):
+    data = {k: user[k] for k in _GET_FIELDS if k != "erasure_date"}
+    data["deleted"] = user["erasure_date"] is not None
+    return data
+
+
+########################################
+# Columns
+########################################
+
+_CREATE_COLUMNS = (
+    ("id", "ID"),
+    ("name", "Username"),
+)
+
+_GET_COLUMNS = (
+    ("id", "ID"),
+    ("name", "Username"),
+    ("display_name", "Display name"),
+    ("email", "Email"),
+    ("is_confirmed", "Confirmed"),
+    ("is_disabled", "Disabled"),
+    ("is_admin", "Admin"),
+    ("is_system", "System"),
+    ("deleted", "Deleted"),
+)
 
-    def display_dict(self):
-        data = self.dict(exclude={"erasure_date"})
-        data["deleted"] = self.erasure_date is not None
-        return data
+_LIST_COLUMNS = (
+    ("id", "ID", 0.1),
+    ("name", "Username", 0.2),
+    ("display_name", "Display name", 0.3),
+    ("email", "Email", 0.3),
+    ("is_admin", "Admin", 0.1),
+)
 
+_UPDATE_COLUMNS = MappingProxyType(
+    {
+        "name": "Username",
+        "display_name": "Display name",
+        "email": "Email",
+    }
+)
 
 ########################################
 # Utils
 ########################################
 
 
-def get_user_id(
+@functools.lru_cache(maxsize=1)
+def _user_ids() -> Dict[str, Tuple[str, float]]:
+
+    """
+    Resolved user ids: 'server url/name' -> (id, resolve time).
+    Loaded from disk once per process. Oldest entries go first
+    """
+
+    user_ids = load_cached(USER_IDS_CACHE, USER_IDS_CACHE_TTL) or {}
+    now = time.time()
+
+    try:
+        return {
+            name: (user_id, resolved_at)
+            for name, (user_id, resolved_at) in user_ids.items()
+            if now - resolved_at <= USER_IDS_CACHE_TTL
+        }
+    except (AttributeError, TypeError, ValueError):
+        return {}  # Broken cache file
+
+
+def _user_ids_key(user: str, client: AutologinClient):
+    server_url = str(client.base_url).rstrip("/")
+    return f"{server_url}/{user}"
+
+
+def _remember_user_id(key: str, user_id: str):
+
+    user_ids = _user_ids()
+    user_ids.pop(key, None)
+    user_ids[key] = (user_id, time.time())
+
+    while len(user_ids) > USER_IDS_CACHE_SIZE:
+        del user_ids[next(iter(user_ids))]
+
+    save_cached(USER_IDS_CACHE, user_ids)
+
+
+def forget_user_id(user_id: str):
+
+    """Drops all names resolved to user id, old names included"""
+
+    user_ids = _user_ids()
+    keys = [key for key, (id_, _) in user_ids.items() if id_ == user_id]
+
+    for key in keys:
+        del user_ids[key]
+
+    if keys:
+        save_cached(USER_IDS_CACHE, user_ids)
+
+
+def _forget_if_not_found(response: Response, user_id: str):
+    if response.status_code == 404:
+        forget_user_id(user_id)
+
+
+def lookup_user_id(
     user: str,
     client: AutologinClient,
+    use_cache: bool = True,
 ):
-    if is_identifier(user):
-        return user
+
+    """
+    Resolves user name to id. Commands changing the user
+    must disable cache, so stale id never gets modified
+    """
+
+    from bondi.helper import parse_response
+
+    key = _user_ids_key(user, client)
+    cached = _user_ids().get(key)
+
+    if cached is not None:
+        if use_cache:
+            return cached[0]
+
+        forget_user_id(cached[0])
 
     url = f"{URL_USERS}/lookup"
     ResponseModel = GetUserResponseModel
@@ -85,19 +251,28 @@ def get_user_id(
     except ServerSideValidationError as e:
         raise InternalError() from e
 
-    return data.id
+    _remember_user_id(key, data["id"])
+    return data["id"]
 
 
-def send_list_users(client: AutologinClient):
+def get_user_id(
+    user: str,
+    client: AutologinClient,
+    use_cache: bool = True,
+):
+    if is_identifier(user):
+        return user
 
-    data = []
-    ResponseModel = GetUserResponseModel
+    return lookup_user_id(user, client, use_cache)
 
-    user: ResponseModel
-    for user in paginate(client, URL_USERS, ResponseModel):
-        data.append(user.dict())
 
-    return data
+def send_list_users(client: AutologinClient):
+
+    from bondi.helper import paginate
+
+    ResponseModel = GetUserResponseModel
+    users = paginate(client, URL_USERS, ResponseModel, USERS_PAGE_SIZE)
+    return [user_dict(user) for user in users]
 
 
 ########################################
@@ -108,11 +283,25 @@ def send_list_users(client: AutologinClient):
 @wrap_autocompletion_errors
 def complete_user_name(username: str):
 
-    with AutologinClient() as client:
+    #
+    # Completion is invoked on each TAB press,
+    # so user names are cached for a short time
+    #
+
+    user_names: Optional[List[str]]
+    user_names = load_cached(USER_NAMES_CACHE, USER_NAMES_CACHE_TTL)
+
+    if user_names is None:
+
+        from bondi.client import get_shared_client
+
+        client = get_shared_client()
         users = send_list_users(client)
 
-    user_names: List[str] = [user["name"] for user in users]
-    return list(filter(lambda u: u.startswith(username), user_names))
+        user_names = sorted(user["name"] for user in users)
+        save_cached(USER_NAMES_CACHE, user_names)
+
+    return prefix_matches(user_names, username)
 
 
 ########################################
@@ -133,7 +322,7 @@ def create_user(
         "--username",
         prompt=True,
         prompt_required=False,
-        callback=validators.string,
+        callback=validators.string_prompted,
         help="Account username",
     ),
     password: str = typer.Option(
@@ -143,7 +332,7 @@ def create_user(
         "--password",
         prompt=True,
         confirmation_prompt=True,
-        callback=validators.string,
+        callback=validators.string_prompted,
         help="Account password",
         hide_input=True,
     ),
@@ -161,7 +350,7 @@ def create_user(
         "--display-name",
         prompt=True,
         prompt_required=False,
-        callback=validators.string,
+        callback=validators.string_prompted,
         help="User's display name",
     ),
     email: str = typer.Option(
@@ -171,10 +360,12 @@ def create_user(
         "--email",
         prompt=True,
         prompt_required=False,
-        callback=validators.email,
+        callback=validators.email_prompted,
         help="User's email",
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = CreateUserResponseModel
@@ -187,16 +378,13 @@ def create_user(
         "email": email,
     }
 
-    with AutologinClient() as client:
-        response = client.post(URL_USERS, json=json_data)
-        data: ResponseModel = parse_response(response, ResponseModel)
+    client = app_ctx.client
+    response = client.post(URL_USERS, json=json_data)
+    data: ResponseModel = parse_response(response, ResponseModel)
 
-    columns = [
-        ("id", "ID"),
-        ("name", "Username"),
-    ]
+    remove_cached(USER_NAMES_CACHE)
 
-    output.dict_data(data.dict(), columns, output_mode)
+    output.dict_data(create_user_dict(data), _CREATE_COLUMNS, output_mode)
 
 
 ########################################
@@ -218,28 +406,33 @@ def get_user(
         help="User's name or id",
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = GetUserResponseModel
 
-    with AutologinClient() as client:
-        user_id = get_user_id(user, client)
+    client = app_ctx.client
+    user_id = get_user_id(user, client)
+    response = client.get(f"{URL_USERS}/{user_id}")
+    _forget_if_not_found(response, user_id)
+
+    # Cached id is stale, if user was erased.
+    # Name may belong to another user now
+    is_name = not is_identifier(user)
+    if is_name and response.status_code == 404:
+        user_id = lookup_user_id(user, client, use_cache=False)
         response = client.get(f"{URL_USERS}/{user_id}")
-        data: ResponseModel = parse_response(response, ResponseModel)
 
-    columns = [
-        ("id", "ID"),
-        ("name", "Username"),
-        ("display_name", "Display name"),
-        ("email", "Email"),
-        ("is_confirmed", "Confirmed"),
-        ("is_disabled", "Disabled"),
-        ("is_admin", "Admin"),
-        ("is_system", "System"),
-        ("deleted", "Deleted"),
-    ]
+    data: ResponseModel = parse_response(response, ResponseModel)
+
+    # Cached id is stale, if user was renamed
+    if is_name and data["name"] != user:
+        user_id = lookup_user_id(user, client, use_cache=False)
+        response = client.get(f"{URL_USERS}/{user_id}")
+        data = parse_response(response, ResponseModel)
 
-    output.dict_data(data.display_dict(), columns, output_mode)
+    output.dict_data(user_display_dict(data), _GET_COLUMNS, output_mode)
 
 
 ########################################
@@ -253,20 +446,12 @@ def get_user(
 )
 def list_users(ctx: typer.Context):
 
-    columns = [
-        ("id", "ID", 0.1),
-        ("name", "Username", 0.2),
-        ("display_name", "Display name", 0.3),
-        ("email", "Email", 0.3),
-        ("is_admin", "Admin", 0.1),
-    ]
-
-    with AutologinClient() as client:
-        data = send_list_users(client)
-
     app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+    data = send_list_users(client)
+
     output_mode = app_ctx.output_mode
-    output.list_data(data, columns, output_mode)
+    output.list_data(data, _LIST_COLUMNS, output_mode)
 
 
 ########################################
@@ -313,33 +498,37 @@ def update_user(
         help="New email",
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = UpdateResponseModel
 
-    json_data = {
-        "name": name,
-        "display_name": display_name,
-        "email": email,
-    }
+    fields = (
+        ("name", name),
+        ("display_name", display_name),
+        ("email", email),
+    )
+
+    # Send only fields to be changed
+    json_data = {k: v for k, v in fields if v is not None}
 
-    if all(v is None for v in json_data.values()):
-        param_names = "|".join(map(make_option, json_data.keys()))
+    if not json_data:
+        param_names = "|".join(make_option(k) for k, _ in fields)
         output.error(f"{C_NO_PARAMS_SET}: [{param_names}]")
         raise typer.Exit(code=1)
 
-    with AutologinClient() as client:
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        response = client.patch(url, json=json_data)
-        data: ResponseModel = parse_response(response, ResponseModel)
+    client = app_ctx.client
+    user_id = get_user_id(user, client, use_cache=False)
+    response = client.patch(f"{URL_USERS}/{user_id}", json=json_data)
+    _forget_if_not_found(response, user_id)
+    data: ResponseModel = parse_response(response, ResponseModel)
 
-    columns = {
-        "name": "Username",
-        "display_name": "Display name",
-        "email": "Email",
-    }
+    if name is not None:
+        remove_cached(USER_NAMES_CACHE)
+        forget_user_id(user_id)
 
-    output.diff_data(data.old, data.new, columns, output_mode)
+    output.diff_data(data.old, data.new, _UPDATE_COLUMNS, output_mode)
 
 
 ########################################
@@ -347,86 +536,126 @@ def update_user(
 ########################################
 
 
-@app.command(
-    name="enable",
-    help="Make user account enabled (remove from ban list)",
-)
-def enable_user(
-    user: str = typer.Argument(
-        ...,
-        callback=validators.string,
-        autocompletion=complete_user_name,
-        help="Name or id of user to enable",
-    ),
+def _patch_user(
+    ctx: typer.Context, user: str, json_data: Dict[str, Any], success_msg: str
 ):
-    with AutologinClient() as client:
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        response = client.patch(url, json={"is_disabled": False})
-        parse_response(response, UpdateResponseModel)
 
-    output.success(f"User enabled")
+    from bondi.helper import parse_response
 
+    app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+    user_id = get_user_id(user, client, use_cache=False)
+    response = client.patch(f"{URL_USERS}/{user_id}", json=json_data)
+    _forget_if_not_found(response, user_id)
+    parse_response(response, UpdateResponseModel)
 
-@app.command(
-    name="disable",
-    help="Make user account disabled (add to ban list)",
-)
-def disable_user(
-    user: str = typer.Argument(
-        ...,
-        callback=validators.string,
-        autocompletion=complete_user_name,
-        help="Name or id of user to disable",
-    ),
+    output.success(success_msg)
+
+
+def _add_patch_command(
+    name: str,
+    json_data: Dict[str, bool],
+    success_msg: str,
+    help: str,
+    short_help: Optional[str] = None,
 ):
-    with AutologinClient() as client:
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        response = client.patch(url, json={"is_disabled": True})
-        parse_response(response, UpdateResponseModel)
+    def patch_user(
+        ctx: typer.Context,
+        user: str = typer.Argument(
+            ...,
+            callback=validators.string,
+            autocompletion=complete_user_name,
+            help=f"Name or id of user to {name}",
+        ),
+    ):
+        _patch_user(ctx, user, json_data, success_msg)
 
-    output.success(f"User disabled")
+    app.command(name=name, help=help, short_help=short_help)(patch_user)
 
 
-@app.command(
+_add_patch_command(
+    name="enable",
+    json_data={"is_disabled": False},
+    success_msg="User enabled",
+    help="Make user account enabled (remove from ban list)",
+)
+
+_add_patch_command(
+    name="disable",
+    json_data={"is_disabled": True},
+    success_msg="User disabled",
+    help="Make user account disabled (add to ban list)",
+)
+
+_add_patch_command(
     name="confirm",
+    json_data={"is_confirmed": True},
+    success_msg="Account confirmed",
     help="Activate account without confirmation by email, phone, etc",
     short_help="Activate user account manually",
 )
-def confirm_user(
-    user: str = typer.Argument(
-        ...,
-        callback=validators.string,
-        autocompletion=complete_user_name,
-        help="Name or id of user to confirm",
-    ),
-):
-    with AutologinClient() as client:
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        response = client.patch(url, json={"is_confirmed": True})
-        parse_response(response, UpdateResponseModel)
-
-    output.success("Account confirmed")
 
-
-@app.command(
+_add_patch_command(
     name="discard",
+    json_data={"is_confirmed": False},
+    success_msg="Account confirmation discarded",
     help="Deactivate account and require confirmation by email, phone, etc",
     short_help="Deactivate user account manually",
 )
-def discard_user(
+
+
+USER_FLAGS = ("is_disabled", "is_confirmed")
+_FLAG_VALUES = {
+    "true": True,
+    "yes": True,
+    "1": True,
+    "false": False,
+    "no": False,
+    "0": False,
+}
+
+
+def parse_user_flags(values: List[str]):
+
+    flags: Dict[str, bool] = {}
+
+    for value in values:
+        name, sep, flag = value.partition("=")
+        name = name.strip()
+
+        if not sep or name not in USER_FLAGS:
+            allowed = "|".join(USER_FLAGS)
+            raise typer.BadParameter(f"Expected [{allowed}]=<bool>, got '{value}'")
+
+        try:
+            flags[name] = _FLAG_VALUES[flag.strip().lower()]
+        except KeyError as e:
+            raise typer.BadParameter(f"Not a boolean value: '{flag}'") from e
+
+    return flags
+
+
+@app.command(
+    name="set",
+    help="Set several account flags with one request",
+    hidden=True,
+)
+def set_user_flags(
+    ctx: typer.Context,
     user: str = typer.Argument(
         ...,
         callback=validators.string,
         autocompletion=complete_user_name,
-        help="Name or id of user to discard",
+        help="Name or id of user to update",
+    ),
+    flags: List[str] = typer.Option(
+        ...,
+        "-f",
+        "--flag",
+        help="Flag to set as name=value, e.g. is_disabled=false. Repeatable",
     ),
 ):
-    with AutologinClient() as client:
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        response = client.patch(url, json={"is_confirmed": False})
-        parse_response(response, UpdateResponseModel)
-
-    output.success("Account confirmation discarded")
+    _patch_user(ctx, user, parse_user_flags(flags), "User updated")
 
 
 ########################################
@@ -439,6 +668,7 @@ def discard_user(
     help="Change account password",
 )
 def change_user_password(
+    ctx: typer.Context,
     user: str = typer.Argument(
         ...,
         callback=validators.string,
@@ -449,17 +679,12 @@ def change_user_password(
         ...,
         prompt=True,
         confirmation_prompt=True,
-        callback=validators.string,
+        callback=validators.string_prompted,
         help="New password",
         hide_input=True,
     ),
 ):
-    with AutologinClient() as client:
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        response = client.patch(url, json={"password": password})
-        parse_response(response, UpdateResponseModel)
-
-    output.success("Account password is changed")
+    _patch_user(ctx, user, {"password": password}, "Account password is changed")
 
 
 ########################################
@@ -480,16 +705,19 @@ def delete_user(
         help="Name or id of user to delete",
     ),
 ):
+    from bondi.helper import parse_response_no_model
+
     app_ctx: AppContext = ctx.obj
     if not app_ctx.auto_approve:
         msg = "Do you really want to delete this user?"
         typer.confirm(msg, abort=True)
 
-    with AutologinClient() as client:
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        query = {"action": DeleteActions.delete.value}
-        response = client.delete(url, params=query)
-        parse_response_no_model(response)
+    client = app_ctx.client
+    user_id = get_user_id(user, client, use_cache=False)
+    query = {"action": DeleteActions.delete.value}
+    response = client.delete(f"{URL_USERS}/{user_id}", params=query)
+    _forget_if_not_found(response, user_id)
+    parse_response_no_model(response)
 
     output.success("User deleted successfully")
 
@@ -499,6 +727,7 @@ def delete_user(
     help="Restore user (move out of trash bin)",
 )
 def restore_user(
+    ctx: typer.Context,
     user: str = typer.Argument(
         ...,
         callback=validators.string,
@@ -506,11 +735,15 @@ def restore_user(
         help="Name or id of user to restore",
     ),
 ):
-    with AutologinClient() as client:
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        query = {"action": DeleteActions.restore.value}
-        response = client.delete(url, params=query)
-        parse_response_no_model(response)
+    from bondi.helper import parse_response_no_model
+
+    app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+    user_id = get_user_id(user, client, use_cache=False)
+    query = {"action": DeleteActions.restore.value}
+    response = client.delete(f"{URL_USERS}/{user_id}", params=query)
+    _forget_if_not_found(response, user_id)
+    parse_response_no_model(response)
 
     output.success("User restored successfully")
 
@@ -532,22 +765,27 @@ def erase_user(
         help="Name or id of user to erase",
     ),
 ):
+    from bondi.helper import parse_response_no_model
+
     app_ctx: AppContext = ctx.obj
     if not app_ctx.auto_approve:
         msg = "Do you really want to erase this user?"
         typer.confirm(f"{C_WARN_UNRECOVERABLE}\n{msg}", abort=True)
 
-    with AutologinClient() as client:
+    client = app_ctx.client
 
-        query = {
-            "action": DeleteActions.erase.value,
-            "no_backup": not backup,
-        }
+    query = {
+        "action": DeleteActions.erase.value,
+        "no_backup": not backup,
+    }
 
-        url = f"{URL_USERS}/{get_user_id(user, client)}"
-        response = client.delete(url, params=query)
-        parse_response_no_model(response)
+    user_id = get_user_id(user, client, use_cache=False)
+    response = client.delete(f"{URL_USERS}/{user_id}", params=query)
+    _forget_if_not_found(response, user_id)
+    parse_response_no_model(response)
 
+    remove_cached(USER_NAMES_CACHE)
+    forget_user_id(user_id)
     output.success("User erased successfully")
 
 
@@ -562,6 +800,7 @@ def erase_user(
     short_help="Enable auto substitution of '--user' option",
 )
 def set_default_user(
+    ctx: typer.Context,
     user: str = typer.Argument(
         ...,
         callback=validators.string,
@@ -569,14 +808,18 @@ def set_default_user(
         help="Name or id of user to set default",
     ),
 ):
-    with AutologinClient() as client:
+    from bondi.helper import parse_response_no_model
+
+    app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
 
-        if not is_identifier(user):
-            user_id = get_user_id(user, client)
-        else:
-            response = client.get(f"{URL_USERS}/{user}")
-            parse_response(response, GetUserResponseModel)
-            user_id = user
+    if not is_identifier(user):
+        user_id = lookup_user_id(user, client, use_cache=False)
+    else:
+        # Only check user exists
+        response = client.get(f"{URL_USERS}/{user}")
+        parse_response_no_model(response)
+        user_id = user
 
     save_default_user(user_id)
     output.success("Default user set successfully")
@@ -588,7 +831,7 @@ def set_default_user(
 )
 def unset_default_user():
 
-    if load_default_user():
+    if has_default_user():
         remove_default_user()
         output.success("Default user unset successfully")
     else:
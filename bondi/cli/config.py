@@ -2,6 +2,7 @@ import typer
 from pydantic import ValidationError
 
 from bondi import output, validators
+from bondi.cache import clear_cache
 from bondi.defaults import remove_default_user
 from bondi.errors import ClientSideValidationError
 from bondi.models import AppContext, AuthConfig
@@ -14,13 +15,27 @@ from bondi.util import load_auth_config, remove_login_result, save_auth_config
 app = typer.Typer(name="config", help="Manage configuration")
 
 
+########################################
+# Columns
+########################################
+
+_SHOW_COLUMNS = (
+    ("url", "URL"),
+    ("username", "Username"),
+    ("password", "Password"),
+)
+
 ########################################
 # Autocompletion
 ########################################
 
 
+_CONFIG_KEYS = ("url", "username", "password")
+_CONFIG_KEYS_SET = frozenset(_CONFIG_KEYS)
+
+
 def config_keys():
-    return ["url", "username", "password"]
+    return _CONFIG_KEYS
 
 
 ########################################
@@ -36,20 +51,20 @@ def init_config(
     server_url: str = typer.Option(
         ...,
         prompt=True,
-        callback=validators.url,
+        callback=validators.url_prompted,
         help="Bondifuzz API server URL",
     ),
     username: str = typer.Option(
         ...,
         prompt=True,
-        callback=validators.string,
+        callback=validators.string_prompted,
         help="Username of Bondifuzz account",
     ),
     password: str = typer.Option(
         ...,
         prompt=True,
         hide_input=True,
-        callback=validators.string,
+        callback=validators.string_prompted,
         help="Password of Bondifuzz account",
     ),
 ):
@@ -62,6 +77,7 @@ def init_config(
     save_auth_config(AuthConfig(**data))
     remove_login_result()  # Remove cookies
     remove_default_user()  # Remove defaults
+    clear_cache()  # Remove data of previous server/account
 
     output.success("Initialization successful")
 
@@ -78,13 +94,12 @@ def get_config_field(
         help="Name of field to show: url, username, password",
     ),
 ):
-    config = load_auth_config().dict()
-
-    if field_name not in config:
+    if field_name not in _CONFIG_KEYS_SET:
         output.error(f"Unknown field name '{field_name}'")
         raise typer.Exit(code=1)
 
-    output.result(config[field_name])
+    config = load_auth_config()
+    output.result(getattr(config, field_name))
 
 
 @app.command(
@@ -105,21 +120,25 @@ def set_config_field(
     ),
 ):
 
-    config = load_auth_config().dict()
-
-    if field_name not in config:
+    if field_name not in _CONFIG_KEYS_SET:
         output.error(f"Unknown field name '{field_name}'")
         raise typer.Exit(code=1)
 
+    config = load_auth_config()
+
     try:
-        config.update({field_name: field_value})
-        save_auth_config(AuthConfig(**config))
+        # Shallow field copy. New value must be validated,
+        # so config.copy(update=...) is not suitable here
+        fields = dict(config)
+        fields[field_name] = field_value
+        save_auth_config(AuthConfig(**fields))
 
     except ValidationError as e:
         raise ClientSideValidationError(e.errors())
 
     remove_login_result()  # Remove cookies
     remove_default_user()  # Remove defaults
+    clear_cache()  # Remove data of previous server/account
     output.success("Config updated successfully")
 
 
@@ -137,10 +156,4 @@ def show_config(
     output_mode = app_ctx.output_mode
     config = load_auth_config()
 
-    columns = [
-        ("url", "URL"),
-        ("username", "Username"),
-        ("password", "Password"),
-    ]
-
-    output.dict_data(config.display_dict(hide), columns, output_mode)
+    output.dict_data(config.display_dict(hide), _SHOW_COLUMNS, output_mode)
@@ -1,93 +1,85 @@
+from __future__ import annotations
+
+import functools
+import time
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional, Tuple
 
 import typer
 from pydantic import BaseModel, validator
+from pydantic.datetime_parse import parse_datetime
 
 from bondi import output, validators
-from bondi.callback import (
-    DefaultFuzzerCallback,
-    DefaultProjectCallback,
-    DefaultUserCallback,
-)
+from bondi.cache import load_cached, save_cached
+from bondi.callback import default_fuzzer_cb, default_project_cb, default_user_cb
 from bondi.cli.admin.users import complete_user_name
-from bondi.cli.user.fuzzers import (
-    complete_fuzzer_name,
-    get_ids_for_fuzzer_url,
-    url_fuzzer,
-)
-from bondi.cli.user.projects import complete_project_name
-from bondi.cli.user.revisions import (
-    complete_revision_name,
-    download_file,
-    get_ids_for_revision_url,
-    url_revision,
-)
-from bondi.client import AutologinClient
-from bondi.defaults import (
-    load_default_fuzzer,
-    load_default_project,
-    load_default_revision,
-    load_default_user,
-)
+from bondi.defaults import load_defaults
 from bondi.errors import BondiError
-from bondi.helper import paginate, parse_response
-from bondi.models import AppContext
-from bondi.util import utc_to_local, wrap_autocompletion_errors
+from bondi.models import AppContext, OutputMode
+from bondi.util import format_date, utc_to_local, wrap_autocompletion_errors
+
+if TYPE_CHECKING:
+    from bondi.client import AutologinClient
 
 app = typer.Typer(name="crashes", help="Found crashes")
 
+# Larger pages -> fewer round-trips when listing crashes
+CRASHES_PAGE_SIZE = 100
+
+# Bounds completion time for huge crash lists.
+# Shells can't display more candidates anyway
+CRASHES_COMPLETION_MAX_PAGES = 10
+CRASHES_COMPLETION_LIMIT = 50
+
+########################################
+# Cache
+########################################
+
+CRASHES_IDS_CACHE = "crashes_ids"
+CRASHES_IDS_CACHE_TTL = 60  # seconds
+CRASHES_IDS_CACHE_SIZE = 64
+
 ########################################
 # Endpoints
 ########################################
 
 
+@functools.lru_cache(maxsize=256)
 def url_crashes_fuzz(fuzzer_id: str, project_id: str, user_id: str):
+    from bondi.cli.user.fuzzers import url_fuzzer
+
     return f"{url_fuzzer(fuzzer_id, project_id, user_id)}/crashes"
 
 
+@functools.lru_cache(maxsize=256)
 def url_crashes_rev(revision_id: str, fuzzer_id: str, project_id: str, user_id: str):
-    return f"{url_revision(revision_id, fuzzer_id, project_id, user_id)}/crashes"
+    from bondi.cli.user.revisions import url_revision
 
-
-def url_crashes(revision_id: str, fuzzer_id: str, project_id: str, user_id: str):
     return f"{url_revision(revision_id, fuzzer_id, project_id, user_id)}/crashes"
 
 
+@functools.lru_cache(maxsize=256)
 def url_crash(crash_id: str, fuzzer_id: str, project_id: str, user_id: str):
     return f"{url_crashes_fuzz(fuzzer_id, project_id, user_id)}/{crash_id}"
 
 
+@functools.lru_cache(maxsize=256)
 def url_crash_raw(crash_id: str, fuzzer_id: str, project_id: str, user_id: str):
     return f"{url_crash(crash_id, fuzzer_id, project_id, user_id)}/raw"
 
 
-def url_crashes(
+def resolve_crashes_url(
     client: AutologinClient,
     revision: Optional[str],
     fuzzer: str,
     project: str,
     user: str,
 ):
+    ids = get_ids_for_crashes_url(revision, fuzzer, project, user, client)
     if revision:
-        return url_crashes_rev(
-            **get_ids_for_revision_url(
-                revision,
-                fuzzer,
-                project,
-                user,
-                client,
-            ),
-        )
+        return url_crashes_rev(**ids)
     else:
-        return url_crashes_fuzz(
-            **get_ids_for_fuzzer_url(
-                fuzzer,
-                project,
-                user,
-                client,
-            ),
-        )
+        return url_crashes_fuzz(**ids)
 
 
 ########################################
@@ -95,7 +87,9 @@ def url_crashes(
 ########################################
 
 
-class GetCrashResponseModel(BaseModel):
+class CrashSummaryModel(BaseModel):
+
+    """Crash without large fields. Used in listing"""
 
     id: str
     """ Unique record id """
@@ -103,18 +97,12 @@ class GetCrashResponseModel(BaseModel):
     created: datetime
     """ Date when crash was retrived """
 
-    preview: str
-    """ Chunk of crash input to preview (base64-encoded) """
-
     type: str
     """ Type of crash: crash, oom, timeout, leak, etc.. """
 
     brief: str
     """ Short description for crash """
 
-    details: Optional[str]
-    """ Crash details (long multiline text) """
-
     reproduced: bool
     """ True if crash was reproduced, else otherwise """
 
@@ -127,15 +115,58 @@ class GetCrashResponseModel(BaseModel):
 
     def display_dict(self):
         data = self.dict()
-        data["created"] = self.created.strftime("%c")
+        data["created"] = format_date(self.created)
         return data
 
 
+class GetCrashResponseModel(CrashSummaryModel):
+
+    preview: str
+    """ Chunk of crash input to preview (base64-encoded) """
+
+    details: Optional[str]
+    """ Crash details (long multiline text) """
+
+
 ########################################
 # Utils
 ########################################
 
 
+@functools.lru_cache(maxsize=None)
+def _crashes_url_ids() -> Dict[str, Tuple[Dict[str, str], float]]:
+
+    """
+    Resolved ids of crashes urls: 'server url/names' -> (ids, resolve time).
+    Used only by completion. Loaded from disk once per process.
+    Oldest entries go first
+    """
+
+    url_ids = load_cached(CRASHES_IDS_CACHE, CRASHES_IDS_CACHE_TTL) or {}
+    now = time.time()
+
+    try:
+        return {
+            key: (dict(ids), resolved_at)
+            for key, (ids, resolved_at) in url_ids.items()
+            if now - resolved_at <= CRASHES_IDS_CACHE_TTL
+        }
+    except (AttributeError, TypeError, ValueError):
+        return {}  # Broken cache file
+
+
+def _remember_crashes_url_ids(key: str, ids: Dict[str, str]):
+
+    url_ids = _crashes_url_ids()
+    url_ids.pop(key, None)
+    url_ids[key] = (ids, time.time())
+
+    while len(url_ids) > CRASHES_IDS_CACHE_SIZE:
+        del url_ids[next(iter(url_ids))]
+
+    save_cached(CRASHES_IDS_CACHE, url_ids)
+
+
 def get_ids_for_crash_url(
     crash_id: str,
     revision: str,
@@ -144,21 +175,79 @@ def get_ids_for_crash_url(
     user: str,
     client: AutologinClient,
 ):
-    ids = get_ids_for_revision_url(revision, fuzzer, project, user, client)
+    ids = get_ids_for_crashes_url(revision, fuzzer, project, user, client)
     return {"crash_id": crash_id, **ids}
 
 
-def send_list_crashes(
+def get_ids_for_crashes_url(
+    revision: Optional[str],
+    fuzzer: str,
+    project: str,
+    user: str,
     client: AutologinClient,
+):
+    from bondi.cli.user.fuzzers import get_ids_for_fuzzer_url
+    from bondi.cli.user.revisions import get_ids_for_revision_url
+
+    if revision:
+        return get_ids_for_revision_url(revision, fuzzer, project, user, client)
+    else:
+        return get_ids_for_fuzzer_url(fuzzer, project, user, client)
+
+
+def get_ids_for_crashes_completion(
     revision: Optional[str],
     fuzzer: str,
     project: str,
     user: str,
+    client: AutologinClient,
 ):
-    data = []
-    ResponseModel = GetCrashResponseModel
 
-    url = url_crashes(
+    #
+    # Completion is invoked on each TAB press, so resolved ids
+    # are saved on disk for a short time. Commands don't use them,
+    # since ids may be stale after fuzzer or revision is changed
+    #
+
+    server_url = str(client.base_url).rstrip("/")
+    names = "/".join(name or "" for name in (user, project, fuzzer, revision))
+    key = f"{server_url}/{names}"
+
+    cached = _crashes_url_ids().get(key)
+    if cached is not None:
+        return cached[0]
+
+    ids = get_ids_for_crashes_url(revision, fuzzer, project, user, client)
+    _remember_crashes_url_ids(key, ids)
+    return ids
+
+
+def send_list_crashes(
+    client: AutologinClient,
+    revision: Optional[str],
+    fuzzer: str,
+    project: str,
+    user: str,
+    summary: bool = True,
+) -> Iterator[Dict[str, Any]]:
+
+    """
+    With 'summary' crashes are listed without large fields
+    (preview and details), which are only needed in JSON output
+    """
+
+    from bondi.helper import paginate
+
+    if summary:
+        ResponseModel = CrashSummaryModel
+
+        # Server omits large fields, if it supports it
+        params = {"exclude": "preview,details"}
+    else:
+        ResponseModel = GetCrashResponseModel
+        params = None
+
+    url = resolve_crashes_url(
         client,
         revision,
         fuzzer,
@@ -166,11 +255,13 @@ def send_list_crashes(
         user,
     )
 
-    crash: ResponseModel
-    for crash in paginate(client, url, ResponseModel):
-        data.append(crash.display_dict())
+    #
+    # Names are resolved above, before any output is shown.
+    # Crashes are fetched page by page, while being printed
+    #
 
-    return data
+    crashes = paginate(client, url, ResponseModel, CRASHES_PAGE_SIZE, params=params)
+    return (crash.display_dict() for crash in crashes)
 
 
 ########################################
@@ -178,32 +269,86 @@ def send_list_crashes(
 ########################################
 
 
+#
+# Completions of other modules are imported on demand,
+# so their modules are not loaded along with this one
+#
+
+
+def complete_fuzzer_name(ctx: typer.Context, incomplete: str):
+    from bondi.cli.user import fuzzers
+
+    return fuzzers.complete_fuzzer_name(ctx, incomplete)
+
+
+def complete_project_name(ctx: typer.Context, incomplete: str):
+    from bondi.cli.user import projects
+
+    return projects.complete_project_name(ctx, incomplete)
+
+
+def complete_revision_name(ctx: typer.Context, incomplete: str):
+    from bondi.cli.user import revisions
+
+    return revisions.complete_revision_name(ctx, incomplete)
+
+
 @wrap_autocompletion_errors
 def complete_crash_id(ctx: typer.Context, incomplete: str):
 
-    revision = ctx.params.get("revision") or load_default_revision()
-    fuzzer = ctx.params.get("fuzzer") or load_default_fuzzer()
-    project = ctx.params.get("project") or load_default_project()
-    user = ctx.params.get("user") or load_default_user()
+    defaults = load_defaults()
+    revision = ctx.params.get("revision") or defaults.revision
+    fuzzer = ctx.params.get("fuzzer") or defaults.fuzzer
+    project = ctx.params.get("project") or defaults.project
+    user = ctx.params.get("user") or defaults.user
 
     if not (fuzzer and project):
         raise BondiError(f"Required parameters not set. Unable to continue")
 
-    def list_crashes_wrapped():
-        return send_list_crashes(
-            client,
-            revision,
-            fuzzer,
-            project,
-            user,
-        )
+    from bondi.client import get_shared_client
+    from bondi.helper import paginate_raw
+
+    #
+    # Server filters crashes by id prefix and omits unused fields,
+    # if it supports it. Otherwise, filters are ignored and crashes
+    # are filtered here. Items are read as plain dicts, only creation
+    # date is parsed. No models are validated in completion.
+    # Candidates are yielded as soon as each page arrives
+    #
+
+    params = {"fields": "id,brief,created"}
+    max_pages = CRASHES_COMPLETION_MAX_PAGES
+    pg_size = None
+
+    # Without prefix every crash matches,
+    # so the first page of candidates is enough
+    if incomplete:
+        params["id_prefix"] = incomplete
+    else:
+        pg_size = CRASHES_COMPLETION_LIMIT
+        max_pages = 1
+
+    client = get_shared_client()
+    ids = get_ids_for_crashes_completion(revision, fuzzer, project, user, client)
+    url = url_crashes_rev(**ids) if revision else url_crashes_fuzz(**ids)
+    crashes = paginate_raw(
+        client,
+        url,
+        pg_size,
+        params=params,
+        max_pages=max_pages,
+    )
+
+    count = 0
+    for crash in crashes:
+        crash_id: str = crash["id"]
+        if crash_id.startswith(incomplete):
+            created = format_date(utc_to_local(parse_datetime(crash["created"])))
+            yield crash_id, f"{crash['brief']} [at {created}]"
 
-    with AutologinClient() as client:
-        for crash in list_crashes_wrapped():
-            crash_id: str = crash["id"]
-            if crash_id.startswith(incomplete):
-                crash_details = f"{crash['brief']} [at {crash['created']}]"
-                yield crash_id, crash_details
+            count += 1
+            if count >= CRASHES_COMPLETION_LIMIT:
+                break
 
 
 ########################################
@@ -227,7 +372,7 @@ def get_crash(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name",
     ),
@@ -235,7 +380,7 @@ def get_crash(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name",
     ),
@@ -243,27 +388,29 @@ def get_crash(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = GetCrashResponseModel
+    client = app_ctx.client
+
+    ids = get_ids_for_crashes_url(
+        revision=None,
+        user=user,
+        project=project,
+        fuzzer=fuzzer,
+        client=client,
+    )
 
-    with AutologinClient() as client:
-
-        ids = get_ids_for_fuzzer_url(
-            user=user,
-            project=project,
-            fuzzer=fuzzer,
-            client=client,
-        )
-
-        response = client.get(url_crash(**ids, crash_id=crash_id))
-        data: ResponseModel = parse_response(response, ResponseModel)
+    response = client.get(url_crash(**ids, crash_id=crash_id))
+    data: ResponseModel = parse_response(response, ResponseModel)
 
     columns = [
         ("id", "ID"),
@@ -287,6 +434,7 @@ def get_crash(
     help="Get crash details (stacktrace)",
 )
 def get_details(
+    ctx: typer.Context,
     crash_id: str = typer.Argument(
         ...,
         callback=validators.string,
@@ -297,7 +445,7 @@ def get_details(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name",
     ),
@@ -305,7 +453,7 @@ def get_details(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name",
     ),
@@ -313,24 +461,28 @@ def get_details(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
-    with AutologinClient() as client:
+    from bondi.helper import parse_response
 
-        ids = get_ids_for_fuzzer_url(
-            user=user,
-            project=project,
-            fuzzer=fuzzer,
-            client=client,
-        )
+    app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+
+    ids = get_ids_for_crashes_url(
+        revision=None,
+        user=user,
+        project=project,
+        fuzzer=fuzzer,
+        client=client,
+    )
 
-        ResponseModel = GetCrashResponseModel
-        response = client.get(url_crash(**ids, crash_id=crash_id))
-        data: ResponseModel = parse_response(response, ResponseModel)
+    ResponseModel = GetCrashResponseModel
+    response = client.get(url_crash(**ids, crash_id=crash_id))
+    data: ResponseModel = parse_response(response, ResponseModel)
 
     output.result("\n" + data.details)
 
@@ -350,7 +502,7 @@ def list_fuzzer_crashes(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name",
     ),
@@ -366,7 +518,7 @@ def list_fuzzer_crashes(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name",
     ),
@@ -374,7 +526,7 @@ def list_fuzzer_crashes(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -389,18 +541,18 @@ def list_fuzzer_crashes(
         ("created", "Created", 0.2),
     ]
 
-    with AutologinClient() as client:
-        data = send_list_crashes(
-            client,
-            revision,
-            fuzzer,
-            project,
-            user,
-        )
-
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
 
+    data = send_list_crashes(
+        app_ctx.client,
+        revision,
+        fuzzer,
+        project,
+        user,
+        summary=output_mode == OutputMode.human,
+    )
+
     if revision:
         msg = f"Crashes for <fuzzer={fuzzer}, revision={revision}>"
     else:
@@ -438,7 +590,7 @@ def download_crash_sample(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name",
     ),
@@ -446,7 +598,7 @@ def download_crash_sample(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name",
     ),
@@ -454,22 +606,23 @@ def download_crash_sample(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import download_file
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
+    client = app_ctx.client
 
-    with AutologinClient() as client:
-
-        url = url_crash_raw(
-            **get_ids_for_fuzzer_url(fuzzer, project, user, client),
-            crash_id=crash_id,
-        )
+    url = url_crash_raw(
+        **get_ids_for_crashes_url(None, fuzzer, project, user, client),
+        crash_id=crash_id,
+    )
 
-        filepath = output_file or f"{crash_id}.crash"
-        download_file("crash", url, filepath, client, output_mode)
-        output.success(f"Saved to {filepath}")
+    filepath = output_file or f"{crash_id}.crash"
+    download_file("crash", url, filepath, client, output_mode)
+    output.success(f"Saved to {filepath}")
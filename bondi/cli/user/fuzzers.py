@@ -1,12 +1,17 @@
-from typing import List, Optional
+from __future__ import annotations
+
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import typer
-from pydantic import BaseModel
 
 from bondi import output, validators
-from bondi.callback import DefaultProjectCallback, DefaultUserCallback, StringCallback
+from bondi.cache import load_cached, remove_cached, save_cached
+from bondi.callback import default_project_cb, default_user_cb, string_cb
 from bondi.cli.admin.users import complete_user_name
-from bondi.client import AutologinClient
 from bondi.constants import C_NO_PARAMS_SET, C_WARN_UNRECOVERABLE
 from bondi.defaults import (
     load_default_fuzzer,
@@ -16,13 +21,6 @@ from bondi.defaults import (
     save_default_fuzzer,
 )
 from bondi.errors import InternalError, ServerSideValidationError
-from bondi.helper import (
-    download_file,
-    paginate,
-    parse_response,
-    parse_response_no_model,
-)
-from bondi.meta import list_fuzzer_configurations
 from bondi.models import (
     AppContext,
     DeleteActions,
@@ -30,10 +28,21 @@ from bondi.models import (
     FuzzingEngine,
     UpdateResponseModel,
 )
-from bondi.util import is_identifier, make_option, shorten, wrap_autocompletion_errors
+from bondi.util import (
+    is_identifier,
+    make_option,
+    prefix_matches,
+    shorten,
+    wrap_autocompletion_errors,
+)
 
 from .projects import complete_project_name, get_ids_for_project_url
 
+if TYPE_CHECKING:
+    from httpx import Response
+
+    from bondi.client import AutologinClient
+
 ########################################
 # App
 ########################################
@@ -45,29 +54,64 @@ app = typer.Typer(name="fuzzers", help="User's fuzzers")
 ########################################
 
 
+@functools.lru_cache(maxsize=256)
 def url_fuzzers(project_id, user_id: str):
     return f"/api/v1/users/{user_id}/projects/{project_id}/fuzzers"
 
 
+@functools.lru_cache(maxsize=256)
 def url_fuzzer(fuzzer_id: str, project_id, user_id: str):
     return f"{url_fuzzers(project_id, user_id)}/{fuzzer_id}"
 
 
+@functools.lru_cache(maxsize=256)
 def url_fuzzer_corpus(fuzzer_id: str, project_id, user_id: str):
     return f"{url_fuzzer(fuzzer_id, project_id, user_id)}/files/corpus"
 
 
+########################################
+# Cache
+########################################
+
+FUZZER_IDS_CACHE = "fuzzer_ids"
+FUZZER_IDS_CACHE_TTL = 300  # seconds
+FUZZER_IDS_CACHE_SIZE = 1024
+
+FUZZER_NAMES_CACHE = "fuzzers_autocomplete"
+FUZZER_NAMES_CACHE_TTL = 60  # seconds
+FUZZER_NAMES_CACHE_SIZE = 64
+
+
 ########################################
 # Models
 ########################################
 
 
-class CreateFuzzerResponseModel(BaseModel):
+@dataclass
+class CreateFuzzerResponseModel:
+
+    """Built from trusted server response without validation"""
+
+    __slots__ = ("id", "name")
+
     id: str
     name: str
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(id=data["id"], name=data["name"])
+
+    def display_dict(self):
+        return {"id": self.id, "name": self.name}
+
+
+@dataclass
+class GetFuzzerResponseModel:
+
+    """Built from trusted server response without validation"""
+
+    __slots__ = ("id", "name", "description", "engine", "lang", "ci_integration")
 
-class GetFuzzerResponseModel(BaseModel):
     id: str
     name: str
     description: str
@@ -75,10 +119,26 @@ class GetFuzzerResponseModel(BaseModel):
     lang: str
     ci_integration: bool
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            description=data["description"],
+            engine=data["engine"],
+            lang=data["lang"],
+            ci_integration=data["ci_integration"],
+        )
+
     def display_dict(self):
-        data = self.dict()
-        data["description"] = shorten(self.description)
-        return data
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": shorten(self.description),
+            "engine": self.engine,
+            "lang": self.lang,
+            "ci_integration": self.ci_integration,
+        }
 
 
 ########################################
@@ -86,14 +146,124 @@ class GetFuzzerResponseModel(BaseModel):
 ########################################
 
 
-def get_fuzzer_id(
+@functools.lru_cache(maxsize=None)
+def _fuzzer_ids() -> Dict[str, Tuple[str, float]]:
+
+    """
+    Resolved fuzzer ids: 'server url/user_id/project_id/name' -> (id, resolve time).
+    Loaded from disk once per process. Oldest entries go first
+    """
+
+    fuzzer_ids = load_cached(FUZZER_IDS_CACHE, FUZZER_IDS_CACHE_TTL) or {}
+    now = time.time()
+
+    try:
+        return {
+            key: (fuzzer_id, resolved_at)
+            for key, (fuzzer_id, resolved_at) in fuzzer_ids.items()
+            if now - resolved_at <= FUZZER_IDS_CACHE_TTL
+        }
+    except (AttributeError, TypeError, ValueError):
+        return {}  # Broken cache file
+
+
+def _fuzzer_ids_key(
     fuzzer: str,
     project_id: str,
     user_id: str,
     client: AutologinClient,
 ):
-    if is_identifier(fuzzer):
-        return fuzzer
+    server_url = str(client.base_url).rstrip("/")
+    return f"{server_url}/{user_id}/{project_id}/{fuzzer}"
+
+
+def _remember_fuzzer_id(key: str, fuzzer_id: str):
+
+    fuzzer_ids = _fuzzer_ids()
+    fuzzer_ids.pop(key, None)
+    fuzzer_ids[key] = (fuzzer_id, time.time())
+
+    while len(fuzzer_ids) > FUZZER_IDS_CACHE_SIZE:
+        del fuzzer_ids[next(iter(fuzzer_ids))]
+
+    save_cached(FUZZER_IDS_CACHE, fuzzer_ids)
+
+
+def forget_fuzzer_id(fuzzer_id: str):
+
+    """Drops all names resolved to fuzzer id, old names included"""
+
+    fuzzer_ids = _fuzzer_ids()
+    keys = [key for key, (id_, _) in fuzzer_ids.items() if id_ == fuzzer_id]
+
+    for key in keys:
+        del fuzzer_ids[key]
+
+    if keys:
+        save_cached(FUZZER_IDS_CACHE, fuzzer_ids)
+
+
+def _forget_if_not_found(response: Response, fuzzer_id: str):
+    if response.status_code == 404:
+        forget_fuzzer_id(fuzzer_id)
+
+
+@functools.lru_cache(maxsize=None)
+def _fuzzer_names() -> Dict[str, Tuple[List[str], float]]:
+
+    """
+    Sorted fuzzer names: 'user/project' -> (names, list time).
+    Loaded from disk once per process. Oldest entries go first
+    """
+
+    fuzzer_names = load_cached(FUZZER_NAMES_CACHE, FUZZER_NAMES_CACHE_TTL) or {}
+    now = time.time()
+
+    try:
+        return {
+            key: (names, listed_at)
+            for key, (names, listed_at) in fuzzer_names.items()
+            if now - listed_at <= FUZZER_NAMES_CACHE_TTL
+        }
+    except (AttributeError, TypeError, ValueError):
+        return {}  # Broken cache file
+
+
+def _remember_fuzzer_names(key: str, names: List[str]):
+
+    fuzzer_names = _fuzzer_names()
+    fuzzer_names.pop(key, None)
+    fuzzer_names[key] = (names, time.time())
+
+    while len(fuzzer_names) > FUZZER_NAMES_CACHE_SIZE:
+        del fuzzer_names[next(iter(fuzzer_names))]
+
+    save_cached(FUZZER_NAMES_CACHE, fuzzer_names)
+
+
+def lookup_fuzzer_id(
+    fuzzer: str,
+    project_id: str,
+    user_id: str,
+    client: AutologinClient,
+    use_cache: bool = True,
+):
+
+    """
+    Resolves fuzzer name to id. Commands changing the fuzzer
+    must disable cache, so stale id never gets modified
+    """
+
+    from bondi.helper import parse_response
+
+    key = _fuzzer_ids_key(fuzzer, project_id, user_id, client)
+    cached = _fuzzer_ids().get(key)
+
+    if cached is not None:
+        if use_cache:
+            return cached[0]
+
+        forget_fuzzer_id(cached[0])
 
     url = f"{url_fuzzers(project_id, user_id)}/lookup"
     response = client.get(url, params={"name": fuzzer})
@@ -104,18 +274,66 @@ def get_fuzzer_id(
     except ServerSideValidationError as e:
         raise InternalError() from e
 
+    _remember_fuzzer_id(key, data.id)
     return data.id
 
 
+def get_fuzzer_id(
+    fuzzer: str,
+    project_id: str,
+    user_id: str,
+    client: AutologinClient,
+    use_cache: bool = True,
+):
+    if is_identifier(fuzzer):
+        return fuzzer
+
+    return lookup_fuzzer_id(fuzzer, project_id, user_id, client, use_cache)
+
+
 def get_ids_for_fuzzer_url(
     fuzzer: str,
     project: str,
     user: Optional[str],
     client: AutologinClient,
+    use_cache: bool = True,
+):
+    # Names are resolved once per client
+    key = ("fuzzer", user, project, fuzzer)
+    cached = client.id_cache.get(key)
+    if cached is not None and use_cache:
+        return cached
+
+    ids = get_ids_for_project_url(project, user, client, use_cache)
+    fuzzer_id = get_fuzzer_id(fuzzer=fuzzer, **ids, client=client, use_cache=use_cache)
+    client.id_cache[key] = ids = {"fuzzer_id": fuzzer_id, **ids}
+    return ids
+
+
+def get_ids_while_confirming(
+    text: str,
+    fuzzer: str,
+    project: str,
+    user: Optional[str],
+    client: AutologinClient,
 ):
-    ids = get_ids_for_project_url(project, user, client)
-    fuzzer_id = get_fuzzer_id(fuzzer=fuzzer, **ids, client=client)
-    return {"fuzzer_id": fuzzer_id, **ids}
+
+    """
+    Resolves fuzzer ids while user answers confirmation prompt.
+    Lookup errors are shown only after confirmation.
+    Cache is not used, since the fuzzer is going to be changed
+    """
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    future = executor.submit(
+        get_ids_for_fuzzer_url, fuzzer, project, user, client, use_cache=False
+    )
+
+    try:
+        typer.confirm(text, abort=True)
+        return future.result()
+    finally:
+        executor.shutdown(wait=False)
 
 
 def send_get_fuzzer(
@@ -124,6 +342,7 @@ def send_get_fuzzer(
     user: Optional[str],
     client: AutologinClient,
 ):
+    from bondi.helper import parse_response
 
     ids = get_ids_for_fuzzer_url(
         user=user,
@@ -134,8 +353,23 @@ def send_get_fuzzer(
 
     ResponseModel = GetFuzzerResponseModel
     response = client.get(url_fuzzer(**ids))
+    _forget_if_not_found(response, ids["fuzzer_id"])
+
+    # Cached id is stale, if fuzzer was erased.
+    # Name may belong to another fuzzer now
+    is_name = not is_identifier(fuzzer)
+    if is_name and response.status_code == 404:
+        ids = get_ids_for_fuzzer_url(fuzzer, project, user, client, use_cache=False)
+        response = client.get(url_fuzzer(**ids))
+
     data: ResponseModel = parse_response(response, ResponseModel)
 
+    # Cached id is stale, if fuzzer was renamed
+    if is_name and data.name != fuzzer:
+        ids = get_ids_for_fuzzer_url(fuzzer, project, user, client, use_cache=False)
+        response = client.get(url_fuzzer(**ids))
+        data = parse_response(response, ResponseModel)
+
     return data
 
 
@@ -144,36 +378,58 @@ def send_list_fuzzers(
     user: Optional[str],
     client: AutologinClient,
 ):
-    data = []
+    from bondi.helper import paginate
+
     ResponseModel = GetFuzzerResponseModel
 
     url = url_fuzzers(
         **get_ids_for_project_url(project, user, client),
     )
 
-    fuzzer: ResponseModel
-    for fuzzer in paginate(client, url, ResponseModel):
-        data.append(fuzzer.display_dict())
+    #
+    # Names are resolved above, before any output is shown.
+    # Fuzzers are fetched page by page, while being printed
+    #
 
-    return data
+    fuzzers = paginate(client, url, ResponseModel, prefetch=True)
+    return (fuzzer.display_dict() for fuzzer in fuzzers)
 
 
 ########################################
 # Autocompletion
 ########################################
 
+_ENGINE_VALUES = tuple(e.value for e in FuzzingEngine)
+_ENGINE_METAVAR = f"[{'|'.join(_ENGINE_VALUES)}]"
+_LANG_VALUES = tuple(l.value for l in FuzzerLang)
+_LANG_METAVAR = f"[{'|'.join(_LANG_VALUES)}]"
+
 
 @wrap_autocompletion_errors
 def complete_fuzzer_name(ctx: typer.Context, incomplete: str):
+    from bondi.client import get_shared_client
 
     user = ctx.params.get("user") or load_default_user()
     project = ctx.params.get("project") or load_default_project()
 
-    with AutologinClient() as client:
+    #
+    # Completion is invoked on each TAB press,
+    # so fuzzer names are cached for a short time
+    #
+
+    key = f"{user or ''}/{project}"
+    cached = _fuzzer_names().get(key)
+
+    if cached is not None:
+        fuzzer_names = cached[0]
+    else:
+        client = get_shared_client()
         fuzzers = send_list_fuzzers(project, user, client)
 
-    fuzzer_names: List[str] = [fuzzer["name"] for fuzzer in fuzzers]
-    return list(filter(lambda u: u.startswith(incomplete), fuzzer_names))
+        fuzzer_names = sorted(fuzzer["name"] for fuzzer in fuzzers)
+        _remember_fuzzer_names(key, fuzzer_names)
+
+    return prefix_matches(fuzzer_names, incomplete)
 
 
 ########################################
@@ -187,12 +443,13 @@ def complete_fuzzer_name(ctx: typer.Context, incomplete: str):
     short_help="Show fuzzing configurations <Lang, Engine>",
 )
 def show_configurations(ctx: typer.Context):
+    from bondi.meta import list_fuzzer_configurations
 
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
 
-    with AutologinClient() as client:
-        data = list_fuzzer_configurations(client)
+    client = app_ctx.client
+    data = list_fuzzer_configurations(client)
 
     columns = [
         ("cpp", "C++"),
@@ -219,7 +476,7 @@ def create_fuzzer(
         None,
         "-n",
         "--name",
-        callback=StringCallback(),
+        callback=string_cb(),
         help="Fuzzer name",
     ),
     description: Optional[str] = typer.Option(
@@ -233,18 +490,18 @@ def create_fuzzer(
         None,
         "-e",
         "--engine",
-        callback=StringCallback(),
-        autocompletion=lambda: [e.value for e in FuzzingEngine],
-        metavar=f"[{'|'.join([e.value for e in FuzzingEngine])}]",
+        callback=string_cb(),
+        autocompletion=lambda: _ENGINE_VALUES,
+        metavar=_ENGINE_METAVAR,
         help="Engine, for which the fuzzer is designed",
     ),
     lang: FuzzerLang = typer.Option(
         None,
         "-l",
         "--lang",
-        callback=StringCallback(),
-        autocompletion=lambda: [e.value for e in FuzzerLang],
-        metavar=f"[{'|'.join([e.value for e in FuzzerLang])}]",
+        callback=string_cb(),
+        autocompletion=lambda: _LANG_VALUES,
+        metavar=_LANG_METAVAR,
         help="Programming language, for which the fuzzer is designed",
     ),
     ci_integration: bool = typer.Option(
@@ -257,7 +514,7 @@ def create_fuzzer(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer will be created",
     ),
@@ -265,12 +522,14 @@ def create_fuzzer(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = CreateFuzzerResponseModel
@@ -283,17 +542,21 @@ def create_fuzzer(
         "lang": lang.value.lower(),
     }
 
-    with AutologinClient() as client:
-        ids = get_ids_for_project_url(project, user, client)
-        response = client.post(url_fuzzers(**ids), json=json_data)
-        data: ResponseModel = parse_response(response, ResponseModel)
+    client = app_ctx.client
+    ids = get_ids_for_project_url(project, user, client, use_cache=False)
+    response = client.post(url_fuzzers(**ids), json=json_data)
+    data: ResponseModel = parse_response(response, ResponseModel)
+
+    # Name may belong to previously deleted fuzzer
+    _remember_fuzzer_id(_fuzzer_ids_key(name, **ids, client=client), data.id)
+    remove_cached(FUZZER_NAMES_CACHE)
 
     columns = [
         ("id", "ID"),
         ("name", "Fuzzer name"),
     ]
 
-    output.dict_data(data.dict(), columns, output_mode)
+    output.dict_data(data.display_dict(), columns, output_mode)
 
 
 ########################################
@@ -317,7 +580,7 @@ def get_fuzzer(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -325,12 +588,13 @@ def get_fuzzer(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
 
@@ -343,8 +607,8 @@ def get_fuzzer(
         ("ci_integration", "CI/CD"),
     ]
 
-    with AutologinClient() as client:
-        data = send_get_fuzzer(fuzzer, project, user, client)
+    client = app_ctx.client
+    data = send_get_fuzzer(fuzzer, project, user, client)
 
     output.dict_data(data.display_dict(), columns, output_mode)
 
@@ -364,7 +628,7 @@ def list_fuzzers(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -372,7 +636,7 @@ def list_fuzzers(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -388,10 +652,10 @@ def list_fuzzers(
         ("ci_integration", "CI/CD", 0.1),
     ]
 
-    with AutologinClient() as client:
-        data = send_list_fuzzers(project, user, client)
-
     app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+    data = send_list_fuzzers(project, user, client)
+
     output_mode = app_ctx.output_mode
     output.list_data(data, columns, output_mode)
 
@@ -433,7 +697,7 @@ def update_fuzzer(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -441,12 +705,14 @@ def update_fuzzer(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = UpdateResponseModel
@@ -461,17 +727,23 @@ def update_fuzzer(
         output.error(f"{C_NO_PARAMS_SET}: [{param_names}]")
         raise typer.Exit(code=1)
 
-    with AutologinClient() as client:
+    client = app_ctx.client
 
-        ids = get_ids_for_fuzzer_url(
-            user=user,
-            fuzzer=fuzzer,
-            project=project,
-            client=client,
-        )
+    ids = get_ids_for_fuzzer_url(
+        user=user,
+        fuzzer=fuzzer,
+        project=project,
+        client=client,
+        use_cache=False,
+    )
 
-        response = client.patch(url_fuzzer(**ids), json=json_data)
-        data: ResponseModel = parse_response(response, ResponseModel)
+    response = client.patch(url_fuzzer(**ids), json=json_data)
+    _forget_if_not_found(response, ids["fuzzer_id"])
+    data: ResponseModel = parse_response(response, ResponseModel)
+
+    if name is not None:
+        forget_fuzzer_id(ids["fuzzer_id"])
+        remove_cached(FUZZER_NAMES_CACHE)
 
     columns = {
         "name": "Project name",
@@ -509,7 +781,7 @@ def download_fuzzer_corpus(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -517,23 +789,25 @@ def download_fuzzer_corpus(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import download_file
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
 
-    with AutologinClient() as client:
+    client = app_ctx.client
 
-        ids = get_ids_for_fuzzer_url(fuzzer, project, user, client)
-        filepath = output_file or f"{ids['fuzzer_id']}.corpus.tar.gz"
-        url = url_fuzzer_corpus(**ids)
+    ids = get_ids_for_fuzzer_url(fuzzer, project, user, client)
+    filepath = output_file or f"{ids['fuzzer_id']}.corpus.tar.gz"
+    url = url_fuzzer_corpus(**ids)
 
-        download_file("corpus", url, filepath, client, output_mode)
-        output.success(f"Saved to {filepath}")
+    download_file("corpus", url, filepath, client, output_mode, by_parts=True)
+    output.success(f"Saved to {filepath}")
 
 
 ########################################
@@ -557,7 +831,7 @@ def delete_fuzzer(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -565,30 +839,30 @@ def delete_fuzzer(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response_no_model
+
     app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+
     if not app_ctx.auto_approve:
         msg = "Do you really want to delete this fuzzer?"
-        typer.confirm(msg, abort=True)
-
-    with AutologinClient() as client:
+        ids = get_ids_while_confirming(msg, fuzzer, project, user, client)
+    else:
+        ids = get_ids_for_fuzzer_url(fuzzer, project, user, client, use_cache=False)
 
-        ids = get_ids_for_fuzzer_url(
-            user=user,
-            project=project,
-            fuzzer=fuzzer,
-            client=client,
-        )
+    url = url_fuzzer(**ids)
+    query = {"action": DeleteActions.delete.value}
+    response = client.delete(url, params=query)
+    parse_response_no_model(response)
 
-        url = url_fuzzer(**ids)
-        query = {"action": DeleteActions.delete.value}
-        response = client.delete(url, params=query)
-        parse_response_no_model(response)
+    forget_fuzzer_id(ids["fuzzer_id"])
+    remove_cached(FUZZER_NAMES_CACHE)
 
     output.success("Fuzzer deleted successfully")
 
@@ -598,6 +872,7 @@ def delete_fuzzer(
     help="Restore deleted fuzzer (move out of trash bin)",
 )
 def restore_fuzzer(
+    ctx: typer.Context,
     fuzzer: str = typer.Argument(
         ...,
         callback=validators.string,
@@ -608,7 +883,7 @@ def restore_fuzzer(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -616,25 +891,31 @@ def restore_fuzzer(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
-    with AutologinClient() as client:
+    from bondi.helper import parse_response_no_model
 
-        ids = get_ids_for_fuzzer_url(
-            user=user,
-            project=project,
-            fuzzer=fuzzer,
-            client=client,
-        )
+    app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
 
-        url = url_fuzzer(**ids)
-        query = {"action": DeleteActions.restore.value}
-        response = client.delete(url, params=query)
-        parse_response_no_model(response)
+    ids = get_ids_for_fuzzer_url(
+        user=user,
+        project=project,
+        fuzzer=fuzzer,
+        client=client,
+        use_cache=False,
+    )
+
+    url = url_fuzzer(**ids)
+    query = {"action": DeleteActions.restore.value}
+    response = client.delete(url, params=query)
+    _forget_if_not_found(response, ids["fuzzer_id"])
+    parse_response_no_model(response)
+    remove_cached(FUZZER_NAMES_CACHE)
 
     output.success("Fuzzer restored successfully")
 
@@ -659,7 +940,7 @@ def erase_fuzzer(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -667,35 +948,36 @@ def erase_fuzzer(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response_no_model
+
     app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+
     if not app_ctx.auto_approve:
         msg = "Do you really want to erase this fuzzer?"
-        typer.confirm(f"{C_WARN_UNRECOVERABLE}\n{msg}", abort=True)
-
-    with AutologinClient() as client:
+        text = f"{C_WARN_UNRECOVERABLE}\n{msg}"
+        ids = get_ids_while_confirming(text, fuzzer, project, user, client)
+    else:
+        ids = get_ids_for_fuzzer_url(fuzzer, project, user, client, use_cache=False)
 
-        ids = get_ids_for_fuzzer_url(
-            user=user,
-            project=project,
-            fuzzer=fuzzer,
-            client=client,
-        )
+    query = {
+        "action": DeleteActions.erase.value,
+        "no_backup": not backup,
+    }
 
-        query = {
-            "action": DeleteActions.erase.value,
-            "no_backup": not backup,
-        }
-
-        url = url_fuzzer(**ids)
-        response = client.delete(url, params=query)
-        parse_response_no_model(response)
+    url = url_fuzzer(**ids)
+    response = client.delete(url, params=query)
+    _forget_if_not_found(response, ids["fuzzer_id"])
+    parse_response_no_model(response)
 
+    forget_fuzzer_id(ids["fuzzer_id"])
+    remove_cached(FUZZER_NAMES_CACHE)
     output.success("Fuzzer erased successfully")
 
 
@@ -710,6 +992,7 @@ def erase_fuzzer(
     short_help="Enable auto substitution of '--fuzzer' option",
 )
 def set_default_fuzzer(
+    ctx: typer.Context,
     fuzzer: str = typer.Argument(
         ...,
         callback=validators.string,
@@ -720,7 +1003,7 @@ def set_default_fuzzer(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -728,26 +1011,40 @@ def set_default_fuzzer(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
-    with AutologinClient() as client:
+    from bondi.helper import parse_response_no_model
 
-        ids = get_ids_for_fuzzer_url(
-            user=user,
-            project=project,
-            fuzzer=fuzzer,
-            client=client,
-        )
+    #
+    # Only fuzzer id is saved. When all ids are given, nothing
+    # needs to be resolved, so no requests are made. Lookup by name
+    # confirms the fuzzer exists, otherwise it's checked with GET
+    #
+
+    fuzzer_is_id = is_identifier(fuzzer)
+
+    if fuzzer_is_id and is_identifier(project):
+        if not user or is_identifier(user):
+            save_default_fuzzer(fuzzer)
+            output.success("Default fuzzer set successfully")
+            return
 
-        if is_identifier(fuzzer):
-            response = client.get(url_fuzzer(**ids))
-            parse_response(response, GetFuzzerResponseModel)
+    app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+    ids = get_ids_for_project_url(project, user, client, use_cache=False)
+
+    if fuzzer_is_id:
+        fuzzer_id = fuzzer
+        response = client.get(url_fuzzer(fuzzer_id, **ids))
+        parse_response_no_model(response)
+    else:
+        fuzzer_id = lookup_fuzzer_id(fuzzer, **ids, client=client, use_cache=False)
 
-    save_default_fuzzer(ids["fuzzer_id"])
+    save_default_fuzzer(fuzzer_id)
     output.success("Default fuzzer set successfully")
 
 
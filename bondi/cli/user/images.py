@@ -1,12 +1,12 @@
+import functools
+from dataclasses import dataclass
 from typing import Optional
 
 import typer
-from pydantic import BaseModel
 
 from bondi import output
-from bondi.callback import DefaultProjectCallback, DefaultUserCallback
+from bondi.callback import default_project_cb, default_user_cb
 from bondi.cli.user.projects import complete_project_name, get_ids_for_project_url
-from bondi.client import AutologinClient
 from bondi.helper import paginate
 from bondi.models import AppContext, FuzzerLang, FuzzingEngine
 from bondi.util import shorten
@@ -22,6 +22,7 @@ app = typer.Typer(name="images", help="User's agent images")
 ########################################
 
 
+@functools.lru_cache(maxsize=256)
 def url_images(project_id: str, user_id: str):
     return f"/api/v1/users/{user_id}/projects/{project_id}/images"
 
@@ -35,19 +36,37 @@ def url_images(project_id: str, user_id: str):
 ########################################
 
 
-class GetImageResponseModel(BaseModel):
+@dataclass
+class GetImageResponseModel:
+
+    """Built from trusted server response without validation"""
+
+    __slots__ = ("id", "name", "description", "type", "status")
+
     id: str
     name: str
     description: str
     type: str
     status: str
-    # engine: str
-    # lang: str
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            description=data["description"],
+            type=data["type"],
+            status=data["status"],
+        )
 
     def display_dict(self):
-        data = self.dict()
-        data["description"] = shorten(self.description)
-        return data
+        return {
+            "id": self.id,
+            "name": self.name,
+            "description": shorten(self.description),
+            "type": self.type,
+            "status": self.status,
+        }
 
 
 @app.command(
@@ -79,7 +98,7 @@ def list_available(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer will be created",
     ),
@@ -87,28 +106,30 @@ def list_available(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
-    data = []
+    app_ctx: AppContext = ctx.obj
     ResponseModel = GetImageResponseModel
 
-    with AutologinClient() as client:
+    client = app_ctx.client
 
-        client.params = {
-            "langs": [lang.value],
-            "engines": [engine.value],
-        }
+    # Filters are sent with image requests only,
+    # not set on the client shared with other requests
+    params = {
+        "langs": [lang.value],
+        "engines": [engine.value],
+    }
 
-        url = url_images(
-            **get_ids_for_project_url(project, user, client),
-        )
+    url = url_images(
+        **get_ids_for_project_url(project, user, client),
+    )
 
-        image: ResponseModel
-        for image in paginate(client, url, ResponseModel):
-            data.append(image.display_dict())
+    # Images are fetched page by page, while being printed
+    images = paginate(client, url, ResponseModel, params=params, prefetch=True)
+    data = (image.display_dict() for image in images)
 
     columns = [
         ("id", "ID", 0.2),
@@ -118,6 +139,5 @@ def list_available(
         ("status", "Status", 0.1),
     ]
 
-    app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     output.list_data(data, columns, output_mode)
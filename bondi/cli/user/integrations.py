@@ -1,4 +1,8 @@
-from typing import Dict, List, Optional
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional
 
 import typer
 from pydantic import BaseModel
@@ -6,17 +10,15 @@ from pydantic import BaseModel
 from bondi import output, validators
 from bondi.callback import (
     CallbackInvoker,
-    DefaultProjectCallback,
-    DefaultUserCallback,
-    StringCallback,
-    UrlCallback,
+    default_project_cb,
+    default_user_cb,
+    string_cb,
+    url_cb,
 )
 from bondi.cli.admin.users import complete_user_name
-from bondi.client import AutologinClient
 from bondi.constants import C_NO_PARAMS_SET, C_NOT_YET, C_WARN_UNRECOVERABLE
-from bondi.defaults import load_default_project, load_default_user
+from bondi.defaults import load_defaults
 from bondi.errors import InternalError, ServerSideValidationError
-from bondi.helper import paginate, parse_response, parse_response_no_model
 from bondi.models import (
     AppContext,
     ICredentialsDisplay,
@@ -28,6 +30,9 @@ from bondi.util import is_identifier, make_option, wrap_autocompletion_errors
 
 from .projects import complete_project_name, get_ids_for_project_url
 
+if TYPE_CHECKING:
+    from bondi.client import AutologinClient
+
 ########################################
 # App
 ########################################
@@ -39,18 +44,22 @@ app = typer.Typer(name="integrations", help="Project integrations")
 ########################################
 
 
+@functools.lru_cache(maxsize=256)
 def url_integrations(project_id, user_id: str):
     return f"/api/v1/users/{user_id}/projects/{project_id}/integrations"
 
 
+@functools.lru_cache(maxsize=256)
 def url_integration(integration_id: str, project_id, user_id: str):
     return f"{url_integrations(project_id, user_id)}/{integration_id}"
 
 
+@functools.lru_cache(maxsize=256)
 def url_integration_enable(integration_id: str, project_id, user_id: str):
     return f"{url_integration(integration_id, project_id, user_id)}/enabled"
 
 
+@functools.lru_cache(maxsize=256)
 def url_integration_config(integration_id: str, project_id, user_id: str):
     return f"{url_integration(integration_id, project_id, user_id)}/config"
 
@@ -60,7 +69,20 @@ def url_integration_config(integration_id: str, project_id, user_id: str):
 ########################################
 
 
-class CreateIntegrationResponseModel(BaseModel):
+@dataclass
+class CreateIntegrationResponseModel:
+
+    """Built from trusted server response without validation"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "status",
+        "enabled",
+        "num_undelivered",
+        "last_error",
+    )
 
     id: str
     """ Unique identifier of integration """
@@ -83,15 +105,45 @@ class CreateIntegrationResponseModel(BaseModel):
     last_error: Optional[str]
     """ Last error caused integration to fail """
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            type=IntegrationType(data["type"]),
+            status=IntegrationStatus(data["status"]),
+            enabled=data["enabled"],
+            num_undelivered=data["num_undelivered"],
+            last_error=data["last_error"],
+        )
+
     def display_dict(self):
-        data = self.dict()
-        data["type"] = self.type.value
-        data["status"] = self.status.value
-        data["last_error"] = self.last_error or C_NOT_YET
-        return data
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type.value,
+            "status": self.status.value,
+            "enabled": self.enabled,
+            "num_undelivered": self.num_undelivered,
+            "last_error": self.last_error or C_NOT_YET,
+        }
+
+
+@dataclass
+class GetIntegrationResponseModel:
 
+    """Built from trusted server response without validation"""
+
+    __slots__ = (
+        "id",
+        "name",
+        "type",
+        "status",
+        "last_error",
+        "num_undelivered",
+        "enabled",
+    )
 
-class GetIntegrationResponseModel(BaseModel):
     id: str
     name: str
     type: IntegrationType
@@ -100,12 +152,28 @@ class GetIntegrationResponseModel(BaseModel):
     num_undelivered: int
     enabled: bool
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(
+            id=data["id"],
+            name=data["name"],
+            type=IntegrationType(data["type"]),
+            status=IntegrationStatus(data["status"]),
+            last_error=data["last_error"],
+            num_undelivered=data["num_undelivered"],
+            enabled=data["enabled"],
+        )
+
     def display_dict(self):
-        data = self.dict()
-        data["type"] = self.type.value
-        data["status"] = self.status.value
-        data["last_error"] = self.last_error or C_NOT_YET
-        return data
+        return {
+            "id": self.id,
+            "name": self.name,
+            "type": self.type.value,
+            "status": self.status.value,
+            "last_error": self.last_error or C_NOT_YET,
+            "num_undelivered": self.num_undelivered,
+            "enabled": self.enabled,
+        }
 
 
 class JiraIntegrationConfig(BaseModel, ICredentialsDisplay):
@@ -120,11 +188,19 @@ class JiraIntegrationConfig(BaseModel, ICredentialsDisplay):
 
     def display_dict(self, hide: bool = True):
 
-        data = self.dict()
+        data = {
+            "id": self.id,
+            "url": self.url,
+            "project": self.project,
+            "username": self.username,
+            "password": self.password,
+            "issue_type": self.issue_type,
+            "priority": self.priority,
+        }
 
         if hide:
-            data["username"] = "*" * 16 + data["username"][-4:]
-            data["password"] = "*" * 16 + data["password"][-4:]
+            data["username"] = "*" * 16 + self.username[-4:]
+            data["password"] = "*" * 16 + self.password[-4:]
 
         return data
 
@@ -136,6 +212,11 @@ class JiraIntegrationConfig(BaseModel, ICredentialsDisplay):
 JIRA_ISSUE_TYPES = ["Bug", "Story", "Task", "<Custom>"]
 JIRA_PRIORITIES = ["Lowest", "Low", "Medium", "High", "Highest", "<Custom>"]
 
+_JIRA_ISSUE_TYPES_METAVAR = f"[{'|'.join(JIRA_ISSUE_TYPES)}]"
+_JIRA_PRIORITIES_METAVAR = f"[{'|'.join(JIRA_PRIORITIES)}]"
+_INTEGRATION_TYPE_VALUES = tuple(t.value for t in IntegrationType)
+_INTEGRATION_TYPE_METAVAR = f"[{'|'.join(_INTEGRATION_TYPE_VALUES)}]"
+
 
 def get_integration_id(
     integration: str,
@@ -143,11 +224,13 @@ def get_integration_id(
     user_id: str,
     client: AutologinClient,
 ):
+    from bondi.helper import parse_response
+
     if is_identifier(integration):
         return integration
 
     url = url_integrations(project_id, user_id)
-    response = client.get(f"{url}/lookup?name={integration}")
+    response = client.get(f"{url}/lookup", params={"name": integration})
     ResponseModel = GetIntegrationResponseModel
 
     try:
@@ -163,22 +246,32 @@ def get_ids_for_integration_url(
     project: str,
     user: str,
     client: AutologinClient,
+    use_cache: bool = True,
 ):
-    ids = get_ids_for_project_url(project, user, client)
+    # Names are resolved once per client
+    key = ("integration", user, project, integration)
+    cached = client.id_cache.get(key)
+    if cached is not None and use_cache:
+        return cached
+
+    ids = get_ids_for_project_url(project, user, client, use_cache)
     integration_id = get_integration_id(integration=integration, **ids, client=client)
-    return {"integration_id": integration_id, **ids}
+    client.id_cache[key] = ids = {"integration_id": integration_id, **ids}
+    return ids
 
 
 def send_create_integration(
     json_data: Dict[str, str],
     project: str,
     user: str,
+    client: AutologinClient,
 ):
-    with AutologinClient() as client:
-        ResponseModel = CreateIntegrationResponseModel
-        ids = get_ids_for_project_url(project, user, client)
-        response = client.post(url_integrations(**ids), json=json_data)
-        data: ResponseModel = parse_response(response, ResponseModel)
+    from bondi.helper import parse_response
+
+    ResponseModel = CreateIntegrationResponseModel
+    ids = get_ids_for_project_url(project, user, client, use_cache=False)
+    response = client.post(url_integrations(**ids), json=json_data)
+    data: ResponseModel = parse_response(response, ResponseModel)
 
     return data
 
@@ -187,40 +280,54 @@ def send_get_integration(
     integration: str,
     project: str,
     user: str,
+    client: AutologinClient,
 ):
-    with AutologinClient() as client:
+    from bondi.helper import parse_response
 
-        ids = get_ids_for_integration_url(
-            user=user,
-            integration=integration,
-            project=project,
-            client=client,
-        )
+    ids = get_ids_for_integration_url(
+        user=user,
+        integration=integration,
+        project=project,
+        client=client,
+    )
 
-        ResponseModel = GetIntegrationResponseModel
-        response = client.get(url_integration(**ids))
-        data: ResponseModel = parse_response(response, ResponseModel)
+    ResponseModel = GetIntegrationResponseModel
+    response = client.get(url_integration(**ids))
+    data: ResponseModel = parse_response(response, ResponseModel)
 
     return data
 
 
+def _integration_row(item: dict):
+    return {
+        "id": item["id"],
+        "name": item["name"],
+        "type": item["type"],
+        "status": item["status"],
+        "last_error": item["last_error"] or C_NOT_YET,
+        "num_undelivered": item["num_undelivered"],
+        "enabled": item["enabled"],
+    }
+
+
 def send_list_integrations(
     project: str,
     user: Optional[str],
     client: AutologinClient,
-):
-    data = []
-    ResponseModel = GetIntegrationResponseModel
+) -> Iterator[dict]:
+    from bondi.helper import paginate_raw
 
     url = url_integrations(
         **get_ids_for_project_url(project, user, client),
     )
 
-    integration: ResponseModel
-    for integration in paginate(client, url, ResponseModel):
-        data.append(integration.display_dict())
+    #
+    # Names are resolved above, before any output is shown.
+    # Rows are only displayed, so items are read as plain dicts.
+    # Type and status are already strings in response
+    #
 
-    return data
+    return (_integration_row(item) for item in paginate_raw(client, url))
 
 
 ########################################
@@ -230,15 +337,25 @@ def send_list_integrations(
 
 @wrap_autocompletion_errors
 def complete_integration_name(ctx: typer.Context, incomplete: str):
+    from bondi.client import get_shared_client
+    from bondi.helper import paginate_raw
+
+    defaults = load_defaults()
+    user = ctx.params.get("user") or defaults.user
+    project = ctx.params.get("project") or defaults.project
+
+    client = get_shared_client()
+    url = url_integrations(
+        **get_ids_for_project_url(project, user, client),
+    )
 
-    user = ctx.params.get("user") or load_default_user()
-    project = ctx.params.get("project") or load_default_project()
+    # Only names are needed, no display rows are built
+    integr_names: List[str] = [item["name"] for item in paginate_raw(client, url)]
 
-    with AutologinClient() as client:
-        integrations = send_list_integrations(project, user, client)
+    if not incomplete:
+        return integr_names
 
-    integr_names: List[str] = [integr["name"] for integr in integrations]
-    return list(filter(lambda u: u.startswith(incomplete), integr_names))
+    return [name for name in integr_names if name.startswith(incomplete)]
 
 
 ########################################
@@ -246,8 +363,19 @@ def complete_integration_name(ctx: typer.Context, incomplete: str):
 ########################################
 
 
+# Config key, command option name, option callback factory
+_JIRA_CONFIG_OPTIONS = (
+    ("url", "jira_url", url_cb),
+    ("username", "jira_username", string_cb),
+    ("password", "jira_password", string_cb),
+    ("project", "jira_project", string_cb),
+    ("priority", "jira_priority", string_cb),
+    ("issue_type", "jira_issue_type", string_cb),
+)
+
+
 def make_jira_config_dict(
-    invoker: CallbackInvoker,
+    ctx: typer.Context,
     url: Optional[str],
     username: Optional[str],
     password: Optional[str],
@@ -256,43 +384,7 @@ def make_jira_config_dict(
     issue_type: Optional[str],
     required: bool = True,
 ):
-    if not url:
-        url = invoker.invoke_callback_for_option(
-            option_name="jira_url",
-            callback=UrlCallback(required),
-        )
-
-    if not username:
-        username = invoker.invoke_callback_for_option(
-            option_name="jira_username",
-            callback=StringCallback(required),
-        )
-
-    if not password:
-        password = invoker.invoke_callback_for_option(
-            option_name="jira_password",
-            callback=StringCallback(required),
-        )
-
-    if not project:
-        project = invoker.invoke_callback_for_option(
-            option_name="jira_project",
-            callback=StringCallback(required),
-        )
-
-    if not priority:
-        priority = invoker.invoke_callback_for_option(
-            option_name="jira_priority",
-            callback=StringCallback(required),
-        )
-
-    if not issue_type:
-        issue_type = invoker.invoke_callback_for_option(
-            option_name="jira_issue_type",
-            callback=StringCallback(required),
-        )
-
-    return {
+    cfg = {
         "url": url,
         "username": username,
         "password": password,
@@ -301,6 +393,22 @@ def make_jira_config_dict(
         "issue_type": issue_type,
     }
 
+    #
+    # Missing values are requested with option callbacks.
+    # Invoker is created only if some value is missing
+    #
+
+    invoker: Optional[CallbackInvoker] = None
+    for key, option_name, make_callback in _JIRA_CONFIG_OPTIONS:
+        if not cfg[key]:
+            invoker = invoker or CallbackInvoker(ctx)
+            cfg[key] = invoker.invoke_callback_for_option(
+                option_name=option_name,
+                callback=make_callback(required),
+            )
+
+    return cfg
+
 
 @app.command(
     name="create",
@@ -314,42 +422,42 @@ def create_integration(
     jira_url: Optional[str] = typer.Option(
         None,
         "--jira-url",
-        callback=UrlCallback(required=False),
+        callback=url_cb(required=False),
         help="Url to Jira server",
     ),
     jira_username: Optional[str] = typer.Option(
         None,
         "--jira-username",
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
         help="Jira account username",
     ),
     jira_password: Optional[str] = typer.Option(
         None,
         "--jira-password",
         hide_input=True,
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
         help="Jira account password or access token",
     ),
     jira_project: Optional[str] = typer.Option(
         None,
         "--jira-project",
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
         help="Jira project name",
     ),
     jira_issue_type: Optional[str] = typer.Option(
         None,
         "--jira-issue-type",
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
         autocompletion=lambda: JIRA_ISSUE_TYPES,
-        metavar=f"[{'|'.join(JIRA_ISSUE_TYPES)}]",
+        metavar=_JIRA_ISSUE_TYPES_METAVAR,
         help="Jira issue type",
     ),
     jira_priority: Optional[str] = typer.Option(
         None,
         "--jira-priority",
         autocompletion=lambda: JIRA_PRIORITIES,
-        metavar=f"[{'|'.join(JIRA_PRIORITIES)}]",
-        callback=StringCallback(required=False),
+        metavar=_JIRA_PRIORITIES_METAVAR,
+        callback=string_cb(required=False),
         help="Jira priority",
     ),
     ########################################
@@ -359,23 +467,23 @@ def create_integration(
         None,
         "-n",
         "--name",
-        callback=StringCallback(),
+        callback=string_cb(),
         help="Integration name",
     ),
     integration_type: IntegrationType = typer.Option(
         None,
         "-t",
         "--type",
-        callback=StringCallback(),
-        autocompletion=lambda: [t.value for t in IntegrationType],
-        metavar=f"[{'|'.join([t.value for t in IntegrationType])}]",
+        callback=string_cb(),
+        autocompletion=lambda: _INTEGRATION_TYPE_VALUES,
+        metavar=_INTEGRATION_TYPE_METAVAR,
         help="Integration type",
     ),
     project: str = typer.Option(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -383,7 +491,7 @@ def create_integration(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -391,7 +499,6 @@ def create_integration(
 ):
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
-    invoker = CallbackInvoker(ctx)
 
     json_data = {
         "name": integration_name,
@@ -401,7 +508,7 @@ def create_integration(
     if integration_type == IntegrationType.jira:
 
         cfg = make_jira_config_dict(
-            invoker,
+            ctx,
             jira_url,
             jira_username,
             jira_password,
@@ -415,6 +522,7 @@ def create_integration(
             json_data,
             project,
             user,
+            app_ctx.client,
         )
 
     else:
@@ -453,7 +561,7 @@ def get_integration(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -461,7 +569,7 @@ def get_integration(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -474,6 +582,7 @@ def get_integration(
         integration,
         project,
         user,
+        app_ctx.client,
     )
 
     columns = [
@@ -504,7 +613,7 @@ def list_integrations(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -512,14 +621,15 @@ def list_integrations(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
-    with AutologinClient() as client:
-        data = send_list_integrations(project, user, client)
+    app_ctx: AppContext = ctx.obj
+    output_mode = app_ctx.output_mode
+    data = send_list_integrations(project, user, app_ctx.client)
 
     columns = [
         ("id", "ID", 0.2),
@@ -530,8 +640,6 @@ def list_integrations(
         ("num_undelivered", "Undelivered reports", 0.2),
     ]
 
-    app_ctx: AppContext = ctx.obj
-    output_mode = app_ctx.output_mode
     output.list_data(data, columns, output_mode)
 
 
@@ -563,7 +671,7 @@ def update_integration(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -571,12 +679,14 @@ def update_integration(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = UpdateResponseModel
@@ -590,17 +700,19 @@ def update_integration(
         output.error(f"{C_NO_PARAMS_SET}: [{param_names}]")
         raise typer.Exit(code=1)
 
-    with AutologinClient() as client:
+    client = app_ctx.client
 
-        ids = get_ids_for_integration_url(
-            user=user,
-            integration=integration,
-            project=project,
-            client=client,
-        )
+    ids = get_ids_for_integration_url(
+        user=user,
+        integration=integration,
+        project=project,
+        client=client,
+        use_cache=False,
+    )
 
-        response = client.patch(url_integration(**ids), json=json_data)
-        data: ResponseModel = parse_response(response, ResponseModel)
+    response = client.patch(url_integration(**ids), json=json_data)
+    data: ResponseModel = parse_response(response, ResponseModel)
+    client.id_cache.pop(("integration", user, project, integration), None)
 
     columns = {
         "name": "Integration name",
@@ -634,7 +746,7 @@ def get_integration_config(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -642,62 +754,64 @@ def get_integration_config(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
     ResponseModel = GetIntegrationResponseModel
 
-    with AutologinClient() as client:
+    client = app_ctx.client
 
-        ids = get_ids_for_integration_url(
-            user=user,
-            integration=integration,
-            project=project,
-            client=client,
-        )
+    ids = get_ids_for_integration_url(
+        user=user,
+        integration=integration,
+        project=project,
+        client=client,
+    )
 
-        response = client.get(url_integration(**ids))
-        integration: ResponseModel = parse_response(response, ResponseModel)
+    response = client.get(url_integration(**ids))
+    integration: ResponseModel = parse_response(response, ResponseModel)
 
-        if integration.type == IntegrationType.jira:
+    if integration.type == IntegrationType.jira:
 
-            columns = [
-                ("id", "Config ID"),
-                ("url", "Jira URL"),
-                ("username", "Username"),
-                ("password", "Password"),
-                ("project", "Project"),
-                ("issue_type", "Issue type"),
-                ("priority", "Priority"),
-            ]
+        columns = [
+            ("id", "Config ID"),
+            ("url", "Jira URL"),
+            ("username", "Username"),
+            ("password", "Password"),
+            ("project", "Project"),
+            ("issue_type", "Issue type"),
+            ("priority", "Priority"),
+        ]
 
-            ResponseModelCfg = JiraIntegrationConfig
+        ResponseModelCfg = JiraIntegrationConfig
 
-        # elif integration.type == IntegrationType.youtrack:
+    # elif integration.type == IntegrationType.youtrack:
 
-        #     columns = [
-        #         ("id", "ID"),
-        #         ("name", "Integration name"),
-        #         ("type", "Type"),
-        #         ("status", "Status"),
-        #         ("enabled", "Enabled"),
-        #         ("num_undelivered", "Undelivered reports"),
-        #         ("last_error", "Last Error"),
-        #     ]
+    #     columns = [
+    #         ("id", "ID"),
+    #         ("name", "Integration name"),
+    #         ("type", "Type"),
+    #         ("status", "Status"),
+    #         ("enabled", "Enabled"),
+    #         ("num_undelivered", "Undelivered reports"),
+    #         ("last_error", "Last Error"),
+    #     ]
 
-        #     ResponseModelCfg = GetJiraIntegrationConfigResponseModel
+    #     ResponseModelCfg = GetJiraIntegrationConfigResponseModel
 
-        else:
-            assert False, "Unreachable"
+    else:
+        assert False, "Unreachable"
 
-        response = client.get(url_integration_config(**ids))
-        config: ResponseModelCfg = parse_response(response, ResponseModelCfg)
-        output.dict_data(config.display_dict(hide), columns, output_mode)
+    response = client.get(url_integration_config(**ids))
+    config: ResponseModelCfg = parse_response(response, ResponseModelCfg)
+    output.dict_data(config.display_dict(hide), columns, output_mode)
 
 
 ########################################
@@ -707,26 +821,18 @@ def get_integration_config(
 
 def send_update_integration(
     json_data: Dict[str, str],
-    integration: str,
-    project: str,
-    user: str,
+    ids: Dict[str, str],
+    client: AutologinClient,
 ):
-    with AutologinClient() as client:
-
-        ids = get_ids_for_integration_url(
-            user=user,
-            integration=integration,
-            project=project,
-            client=client,
-        )
+    from bondi.helper import parse_response
 
-        # TODO: put -> patch when partial update will be implemented
+    # TODO: put -> patch when partial update will be implemented
 
-        url = url_integration_config(**ids)
-        response = client.put(url, json=json_data)
+    url = url_integration_config(**ids)
+    response = client.put(url, json=json_data)
 
-        ResponseModel = UpdateResponseModel
-        data: ResponseModel = parse_response(response, ResponseModel)
+    ResponseModel = UpdateResponseModel
+    data: ResponseModel = parse_response(response, ResponseModel)
 
     return data
 
@@ -743,37 +849,41 @@ def update_integration_config(
     jira_url: Optional[str] = typer.Option(
         None,
         "--jira-url",
-        callback=UrlCallback(required=False),
+        callback=url_cb(required=False),
         help="New Jira server url",
     ),
     jira_username: Optional[str] = typer.Option(
         None,
         "--jira-username",
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
         help="New Jira account username",
     ),
     jira_password: Optional[str] = typer.Option(
         None,
         "--jira-password",
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
         help="New Jira account password or access token",
     ),
     jira_project: Optional[str] = typer.Option(
         None,
         "--jira-project",
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
         help="New Jira project name",
     ),
     jira_issue_type: Optional[str] = typer.Option(
         None,
         "--jira-issue-type",
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
+        autocompletion=lambda: JIRA_ISSUE_TYPES,
+        metavar=_JIRA_ISSUE_TYPES_METAVAR,
         help="New Jira issue type",
     ),
     jira_priority: Optional[str] = typer.Option(
         None,
         "--jira-priority",
-        callback=StringCallback(required=False),
+        callback=string_cb(required=False),
+        autocompletion=lambda: JIRA_PRIORITIES,
+        metavar=_JIRA_PRIORITIES_METAVAR,
         help="New Jira priority",
     ),
     ########################################
@@ -789,7 +899,7 @@ def update_integration_config(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -797,22 +907,35 @@ def update_integration_config(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response
+
     app_ctx: AppContext = ctx.obj
     output_mode = app_ctx.output_mode
-    invoker = CallbackInvoker(ctx)
-
-    target_integration = send_get_integration(
-        integration,
-        project,
-        user,
+    client = app_ctx.client
+
+    #
+    # Ids are resolved once and reused for both requests.
+    # Integration type defines config to be updated
+    #
+
+    ids = get_ids_for_integration_url(
+        user=user,
+        integration=integration,
+        project=project,
+        client=client,
+        use_cache=False,
     )
 
+    ResponseModel = GetIntegrationResponseModel
+    response = client.get(url_integration(**ids))
+    target_integration: ResponseModel = parse_response(response, ResponseModel)
+
     json_data = {
         "type": target_integration.type,
     }
@@ -820,7 +943,7 @@ def update_integration_config(
     if target_integration.type == IntegrationType.jira:
 
         cfg = make_jira_config_dict(
-            invoker,
+            ctx,
             jira_url,
             jira_username,
             jira_password,
@@ -836,12 +959,7 @@ def update_integration_config(
             raise typer.Exit(code=1)
 
         json_data.update({"config": cfg})
-        data = send_update_integration(
-            json_data,
-            integration,
-            project,
-            user,
-        )
+        data = send_update_integration(json_data, ids, client)
 
         columns = {
             "id": "Config ID",
@@ -869,6 +987,7 @@ def update_integration_config(
     help="Enable crash notifications in bug tracker",
 )
 def enable_integration(
+    ctx: typer.Context,
     integration: str = typer.Argument(
         ...,
         callback=validators.string,
@@ -879,7 +998,7 @@ def enable_integration(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -887,24 +1006,28 @@ def enable_integration(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
-    with AutologinClient() as client:
+    from bondi.helper import parse_response
 
-        ids = get_ids_for_integration_url(
-            user=user,
-            integration=integration,
-            project=project,
-            client=client,
-        )
+    app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+
+    ids = get_ids_for_integration_url(
+        user=user,
+        integration=integration,
+        project=project,
+        client=client,
+        use_cache=False,
+    )
 
-        url = url_integration_enable(**ids)
-        response = client.put(url, json={"enabled": True})
-        parse_response(response, UpdateResponseModel)
+    url = url_integration_enable(**ids)
+    response = client.put(url, json={"enabled": True})
+    parse_response(response, UpdateResponseModel)
 
     output.success(f"Integration enabled")
 
@@ -914,6 +1037,7 @@ def enable_integration(
     help="Disable crash notifications in bug tracker",
 )
 def disable_integration(
+    ctx: typer.Context,
     integration: str = typer.Argument(
         ...,
         callback=validators.string,
@@ -924,7 +1048,7 @@ def disable_integration(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -932,24 +1056,28 @@ def disable_integration(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
-    with AutologinClient() as client:
+    from bondi.helper import parse_response
 
-        ids = get_ids_for_integration_url(
-            user=user,
-            integration=integration,
-            project=project,
-            client=client,
-        )
+    app_ctx: AppContext = ctx.obj
+    client = app_ctx.client
+
+    ids = get_ids_for_integration_url(
+        user=user,
+        integration=integration,
+        project=project,
+        client=client,
+        use_cache=False,
+    )
 
-        url = url_integration_enable(**ids)
-        response = client.put(url, json={"enabled": False})
-        parse_response(response, UpdateResponseModel)
+    url = url_integration_enable(**ids)
+    response = client.put(url, json={"enabled": False})
+    parse_response(response, UpdateResponseModel)
 
     output.success(f"Integration disabled")
 
@@ -975,7 +1103,7 @@ def delete_integration(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Name or id of project",
     ),
@@ -983,27 +1111,31 @@ def delete_integration(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
     ),
 ):
+    from bondi.helper import parse_response_no_model
+
     app_ctx: AppContext = ctx.obj
     if not app_ctx.auto_approve:
         msg = "Do you really want to delete this integration?"
         typer.confirm(f"{C_WARN_UNRECOVERABLE}\n{msg}", abort=True)
 
-    with AutologinClient() as client:
+    client = app_ctx.client
 
-        ids = get_ids_for_integration_url(
-            user=user,
-            project=project,
-            integration=integration,
-            client=client,
-        )
+    ids = get_ids_for_integration_url(
+        user=user,
+        project=project,
+        integration=integration,
+        client=client,
+        use_cache=False,
+    )
 
-        response = client.delete(url_integration(**ids))
-        parse_response_no_model(response)
+    response = client.delete(url_integration(**ids))
+    parse_response_no_model(response)
+    client.id_cache.pop(("integration", user, project, integration), None)
 
     output.success("Integration deleted successfully")
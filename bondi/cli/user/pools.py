@@ -4,7 +4,7 @@ import typer
 from pydantic import BaseModel
 
 from bondi import output, validators
-from bondi.callback import DefaultUserCallback, PositiveIntCallback, StringCallback
+from bondi.callback import default_user_cb, positive_int_cb, string_cb
 from bondi.cli.admin.users import complete_user_name, get_user_id
 from bondi.client import AutologinClient
 from bondi.defaults import  load_default_user
@@ -138,7 +138,7 @@ def get_pool(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the pool (admin only)",
         hidden=True,
@@ -176,7 +176,7 @@ def list_pools(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the pool (admin only)",
         hidden=True,
@@ -5,7 +5,7 @@ import typer
 from pydantic import BaseModel
 
 from bondi import output, validators
-from bondi.callback import DefaultUserCallback, PositiveIntCallback, StringCallback
+from bondi.callback import default_user_cb, positive_int_cb, string_cb
 from bondi.cli.admin.users import complete_user_name, get_user_id
 from bondi.cli.user.pools import complete_pool_id
 from bondi.client import AutologinClient
@@ -130,23 +130,45 @@ def get_project_id(
     return data.id
 
 
-def get_owner_id(user: Optional[str], client: AutologinClient):
-    return client.login_result.user_id if not user else get_user_id(user, client)
+def get_owner_id(
+    user: Optional[str],
+    client: AutologinClient,
+    use_cache: bool = True,
+):
+    if not user:
+        return client.login_result.user_id
+
+    return get_user_id(user, client, use_cache)
 
 
 def get_ids_for_project_url(
     project: str,
     user: Optional[str],
     client: AutologinClient,
+    use_cache: bool = True,
 ):
-    user_id = get_owner_id(user, client)
+
+    """
+    Commands changing or deleting data must disable cache,
+    so owner's name is never resolved to stale id
+    """
+
+    # Names are resolved once per client
+    key = ("project", user, project)
+    cached = client.id_cache.get(key)
+    if cached is not None and use_cache:
+        return cached
+
+    user_id = get_owner_id(user, client, use_cache)
     project_id = get_project_id(project, user_id, client)
 
-    return {
+    client.id_cache[key] = ids = {
         "user_id": user_id,
         "project_id": project_id,
     }
 
+    return ids
+
 
 def send_get_project(
     project: str,
@@ -213,7 +235,7 @@ def create_project(
         None,
         "-n",
         "--name",
-        callback=StringCallback(),
+        callback=string_cb(),
         help="Project name",
     ),
     description: Optional[str] = typer.Option(
@@ -226,7 +248,7 @@ def create_project(
     pool_id: str = typer.Option(
         None,
         "--pool-id",
-        callback=StringCallback(),
+        callback=string_cb(),
         autocompletion=complete_pool_id,
         help="Pool ID",
     ),
@@ -234,7 +256,7 @@ def create_project(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -251,7 +273,7 @@ def create_project(
     }
 
     with AutologinClient() as client:
-        url = url_projects(get_owner_id(user, client))
+        url = url_projects(get_owner_id(user, client, use_cache=False))
         response = client.post(url, json=json_data)
         data: ResponseModel = parse_response(response, ResponseModel)
 
@@ -284,7 +306,7 @@ def get_project(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -330,7 +352,7 @@ def list_projects(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -388,7 +410,7 @@ def update_project(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -414,6 +436,7 @@ def update_project(
             user=user,
             project=project,
             client=client,
+            use_cache=False,
         )
 
         response = client.patch(url_project(**ids), json=json_data)
@@ -448,7 +471,7 @@ def delete_project(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -465,6 +488,7 @@ def delete_project(
             user=user,
             project=project,
             client=client,
+            use_cache=False,
         )
 
         response = client.delete(url_project_pool(**ids))
@@ -489,7 +513,7 @@ def delete_project(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -506,6 +530,7 @@ def delete_project(
             user=user,
             project=project,
             client=client,
+            use_cache=False,
         )
 
         url = url_project(**ids)
@@ -531,7 +556,7 @@ def restore_project(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -543,6 +568,7 @@ def restore_project(
             user=user,
             project=project,
             client=client,
+            use_cache=False,
         )
 
         url = url_project(**ids)
@@ -573,7 +599,7 @@ def erase_project(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -590,6 +616,7 @@ def erase_project(
             user=user,
             project=project,
             client=client,
+            use_cache=False,
         )
 
         query = {
@@ -625,7 +652,7 @@ def set_default_project(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Owner of the project (admin only)",
         hidden=True,
@@ -637,6 +664,7 @@ def set_default_project(
             user=user,
             project=project,
             client=client,
+            use_cache=False,
         )
 
         if is_identifier(project):
@@ -7,10 +7,10 @@ from pydantic import BaseModel, validator
 
 from bondi import output, validators
 from bondi.callback import (
-    DefaultFuzzerCallback,
-    DefaultProjectCallback,
-    DefaultUserCallback,
-    PositiveIntCallback,
+    default_fuzzer_cb,
+    default_project_cb,
+    default_user_cb,
+    positive_int_cb,
 )
 from bondi.cli.admin.users import complete_user_name, get_user_id
 from bondi.cli.user.fuzzers import (
@@ -268,10 +268,24 @@ def get_ids_for_revision_url(
     project: str,
     user: str,
     client: AutologinClient,
+    use_cache: bool = True,
 ):
-    ids = get_ids_for_fuzzer_url(fuzzer, project, user, client)
+
+    """
+    Commands changing or deleting data must disable cache,
+    so fuzzer and owner names are never resolved to stale ids
+    """
+
+    # Names are resolved once per client
+    key = ("revision", user, project, fuzzer, revision)
+    cached = client.id_cache.get(key)
+    if cached is not None and use_cache:
+        return cached
+
+    ids = get_ids_for_fuzzer_url(fuzzer, project, user, client, use_cache)
     revision_id = get_revision_id(revision=revision, **ids, client=client)
-    return {"revision_id": revision_id, **ids}
+    client.id_cache[key] = ids = {"revision_id": revision_id, **ids}
+    return ids
 
 
 def send_list_revisions(
@@ -350,28 +364,28 @@ def create_revision(
         None,
         "--cpu",
         "--cpu-usage",
-        callback=PositiveIntCallback(),
+        callback=positive_int_cb(),
         help="Max amount of CPU to allocate for fuzzer",
     ),
     ram_usage: int = typer.Option(
         None,
         "--ram",
         "--ram-usage",
-        callback=PositiveIntCallback(),
+        callback=positive_int_cb(),
         help="Max amount of RAM to allocate for fuzzer",
     ),
     tmpfs_size: int = typer.Option(
         None,
         "--tmpfs",
         "--tmpfs-size",
-        callback=PositiveIntCallback(),
+        callback=positive_int_cb(),
         help="Tempfs size to allocate for fuzzer",
     ),
     fuzzer: str = typer.Option(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision will be created",
     ),
@@ -379,7 +393,7 @@ def create_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -387,7 +401,7 @@ def create_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -438,7 +452,7 @@ def create_revision(
             msg = "Sum of TmpFS size and RAM usage must be in range: [%d, %d] (MB)"
             raise BadParameterError(ctx, msg % args, "ram_usage", "tmpfs_size")
 
-        ids = get_ids_for_fuzzer_url(fuzzer, project, user, client)
+        ids = get_ids_for_fuzzer_url(fuzzer, project, user, client, use_cache=False)
         response = client.post(url_revisions(**ids), json=json_data)
         data: ResponseModel = parse_response(response, ResponseModel)
 
@@ -501,7 +515,7 @@ def upload_revision_files(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -509,7 +523,7 @@ def upload_revision_files(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -517,7 +531,7 @@ def upload_revision_files(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -534,6 +548,7 @@ def upload_revision_files(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         upload_file(
@@ -591,7 +606,7 @@ def copy_corpus_files(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -599,7 +614,7 @@ def copy_corpus_files(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -607,7 +622,7 @@ def copy_corpus_files(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -622,6 +637,7 @@ def copy_corpus_files(
             fuzzer=fuzzer,
             revision=target_revision,
             client=client,
+            use_cache=False,
         )
 
         ids_ = ids.copy()
@@ -665,7 +681,7 @@ def get_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -673,7 +689,7 @@ def get_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -681,7 +697,7 @@ def get_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -742,7 +758,7 @@ def list_revisions(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -750,7 +766,7 @@ def list_revisions(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -758,7 +774,7 @@ def list_revisions(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -802,7 +818,7 @@ def start_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -810,7 +826,7 @@ def start_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -818,7 +834,7 @@ def start_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -832,6 +848,7 @@ def start_revision(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         response = client.post(url_start(**ids))
@@ -860,7 +877,7 @@ def restart_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -868,7 +885,7 @@ def restart_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -876,7 +893,7 @@ def restart_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -890,6 +907,7 @@ def restart_revision(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         response = client.post(url_restart(**ids))
@@ -918,7 +936,7 @@ def stop_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -926,7 +944,7 @@ def stop_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -934,7 +952,7 @@ def stop_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -948,6 +966,7 @@ def stop_revision(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         response = client.post(url_stop(**ids))
@@ -977,7 +996,7 @@ def update_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -985,7 +1004,7 @@ def update_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -993,7 +1012,7 @@ def update_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -1033,6 +1052,7 @@ def update_revision(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         response = client.patch(url_revision(**ids), json=json_data)
@@ -1067,7 +1087,7 @@ def update_revision_resources(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -1075,7 +1095,7 @@ def update_revision_resources(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -1083,7 +1103,7 @@ def update_revision_resources(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -1123,6 +1143,7 @@ def update_revision_resources(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         response = client.patch(url_resources(**ids), json=json_data)
@@ -1151,7 +1172,7 @@ def get_last_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -1159,7 +1180,7 @@ def get_last_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -1167,7 +1188,7 @@ def get_last_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -1250,7 +1271,7 @@ def download_revision_files(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -1258,7 +1279,7 @@ def download_revision_files(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -1266,7 +1287,7 @@ def download_revision_files(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -1347,7 +1368,7 @@ def delete_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -1355,7 +1376,7 @@ def delete_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -1363,7 +1384,7 @@ def delete_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -1382,6 +1403,7 @@ def delete_revision(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         url = url_revision(**ids)
@@ -1407,7 +1429,7 @@ def restore_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -1415,7 +1437,7 @@ def restore_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -1423,7 +1445,7 @@ def restore_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -1437,6 +1459,7 @@ def restore_revision(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         url = url_revision(**ids)
@@ -1467,7 +1490,7 @@ def erase(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -1475,7 +1498,7 @@ def erase(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -1483,7 +1506,7 @@ def erase(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -1502,6 +1525,7 @@ def erase(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         query = {
@@ -1537,7 +1561,7 @@ def set_default_revision(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name, in which the revision was created",
     ),
@@ -1545,7 +1569,7 @@ def set_default_revision(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name, in which the fuzzer was created",
     ),
@@ -1553,7 +1577,7 @@ def set_default_revision(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -1567,6 +1591,7 @@ def set_default_revision(
             fuzzer=fuzzer,
             revision=revision,
             client=client,
+            use_cache=False,
         )
 
         if is_identifier(revision):
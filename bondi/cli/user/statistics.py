@@ -9,10 +9,10 @@ from pydantic import BaseModel, validator
 
 from bondi import output, validators
 from bondi.callback import (
-    DefaultFuzzerCallback,
-    DefaultProjectCallback,
-    DefaultRevisionCallback,
-    DefaultUserCallback,
+    default_fuzzer_cb,
+    default_project_cb,
+    default_revision_cb,
+    default_user_cb,
 )
 from bondi.cli.admin.users import complete_user_name
 from bondi.cli.user.fuzzers import complete_fuzzer_name, send_get_fuzzer, url_fuzzer
@@ -262,7 +262,7 @@ def show_statistics(
         None,
         "-r",
         "--revision",
-        callback=DefaultRevisionCallback(),
+        callback=default_revision_cb(),
         autocompletion=complete_revision_name,
         help="Revision id or name",
     ),
@@ -270,7 +270,7 @@ def show_statistics(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name",
     ),
@@ -278,7 +278,7 @@ def show_statistics(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name",
     ),
@@ -286,7 +286,7 @@ def show_statistics(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
@@ -569,7 +569,7 @@ def show_statistics_chart(
         None,
         "-r",
         "--revision",
-        callback=DefaultRevisionCallback(),
+        callback=default_revision_cb(),
         autocompletion=complete_revision_name,
         help="Revision id or name",
     ),
@@ -577,7 +577,7 @@ def show_statistics_chart(
         None,
         "-f",
         "--fuzzer",
-        callback=DefaultFuzzerCallback(),
+        callback=default_fuzzer_cb(),
         autocompletion=complete_fuzzer_name,
         help="Fuzzer id or name",
     ),
@@ -585,7 +585,7 @@ def show_statistics_chart(
         None,
         "-p",
         "--project",
-        callback=DefaultProjectCallback(),
+        callback=default_project_cb(),
         autocompletion=complete_project_name,
         help="Project id or name",
     ),
@@ -593,7 +593,7 @@ def show_statistics_chart(
         None,
         "-u",
         "--user",
-        callback=DefaultUserCallback(),
+        callback=default_user_cb(),
         autocompletion=complete_user_name,
         help="Name or id of owner (admin only)",
         hidden=True,
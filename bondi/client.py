@@ -1,10 +1,13 @@
+import atexit
+import functools
+import importlib.util
 import os
 import platform
 import threading
 from contextlib import contextmanager
 from datetime import datetime
 from threading import Condition
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from httpx import USE_CLIENT_DEFAULT, Client, Cookies, Request, Response, TransportError
 from pydantic import BaseModel
@@ -30,6 +33,10 @@ class LoginResultModel(BaseModel):
 COOKIE_USER_ID = "USER_ID"
 COOKIE_SESSION_ID = "SESSION_ID"
 
+# HTTP/2 is negotiated over TLS if 'h2' is installed ('speedups' extra).
+# Concurrent requests are multiplexed over a single connection then
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
 
 class AutologinClient(Client):
 
@@ -40,6 +47,7 @@ class AutologinClient(Client):
     _login_result: Optional[LoginResult]
     _auth_tid: Optional[int]
     _cond_var: Condition
+    _id_cache: Dict[Tuple, dict]
 
     def __init__(self):
 
@@ -59,17 +67,36 @@ class AutologinClient(Client):
             login_result = None
             cookies = None
 
-        super().__init__(base_url=config.url, cookies=cookies)
+        super().__init__(base_url=config.url, cookies=cookies, http2=HTTP2_ENABLED)
         self._username = config.username
         self._password = config.password
         self._login_result = login_result
         self._cond_var = Condition()
         self._auth_tid = None
+        self._id_cache = {}
 
     @property
     def login_result(self):
         return self._login_result
 
+    @property
+    def id_cache(self):
+
+        """
+        Ids of named resources resolved with this client.
+        Valid until the client is closed
+        """
+
+        return self._id_cache
+
+    def close(self):
+        self._id_cache.clear()
+        super().close()
+
+    def __exit__(self, *args):
+        self._id_cache.clear()
+        super().__exit__(*args)
+
     def _check_auth(self):
         if not self._login_result:
             with self._cond_var:
@@ -206,9 +233,12 @@ class AutologinClient(Client):
             raise InternalError()  # TODO: logger.debug
 
         #
+        # Release connection of failed request (in case of streaming).
         # Add obtained cookies to request and send it
         #
 
+        response.close()
+
         Cookies(self.cookies).set_cookie_header(request)
 
         return super().send(
@@ -238,3 +268,17 @@ class AutologinClient(Client):
             raise ConnectionError(request.url) from e
 
         return res
+
+
+@functools.lru_cache(maxsize=1)
+def get_shared_client() -> AutologinClient:
+
+    """
+    Returns client shared by all requests in the process.
+    Its connection pool is reused, so subsequent requests
+    skip TCP/TLS handshake. Client is closed at exit
+    """
+
+    client = AutologinClient().__enter__()
+    atexit.register(client.close)
+    return client
@@ -1,7 +1,10 @@
+import functools
 import os
 from contextlib import suppress
+from dataclasses import dataclass
+from typing import Optional
 
-from .util import APP_DIR
+from .util import APP_DIR, ensure_dir
 
 DEFAULTS_DIR = os.path.join(APP_DIR, "defaults")
 DEFAULT_USER_PATH = os.path.join(DEFAULTS_DIR, "user.txt")
@@ -21,15 +24,22 @@ def read_file(filepath: str):
 
 
 def write_file(filepath: str, data: str):
+    load_defaults.cache_clear()
+    ensure_dir(os.path.dirname(filepath))
     with open(filepath, "w", encoding="utf-8") as f:
         f.write(data)
 
 
 def remove_file(filepath: str):
+    load_defaults.cache_clear()
     with suppress(FileNotFoundError):
         os.remove(filepath)
 
 
+def has_default_user():
+    return os.path.isfile(DEFAULT_USER_PATH)
+
+
 def load_default_user():
     return read_file(DEFAULT_USER_PATH)
 
@@ -46,6 +56,33 @@ def load_default_revision():
     return read_file(DEFAULT_REVISION_PATH)
 
 
+@dataclass
+class Defaults:
+
+    __slots__ = ("user", "project", "fuzzer", "revision")
+
+    user: Optional[str]
+    project: Optional[str]
+    fuzzer: Optional[str]
+    revision: Optional[str]
+
+
+@functools.lru_cache(maxsize=1)
+def load_defaults():
+
+    """
+    Returns all defaults, read once per process.
+    Reset when any of defaults is saved or removed
+    """
+
+    return Defaults(
+        user=load_default_user(),
+        project=load_default_project(),
+        fuzzer=load_default_fuzzer(),
+        revision=load_default_revision(),
+    )
+
+
 def save_default_user(id_string: str):
     write_file(DEFAULT_USER_PATH, id_string)
 
@@ -1,15 +1,29 @@
 from __future__ import annotations
 
 import os
-from typing import IO, TYPE_CHECKING, List, Optional, Type
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import suppress
+from typing import IO, TYPE_CHECKING, Any, Callable, Iterator, List, Optional, Type
 
 import typer
-from httpx import Response
+from httpx import Response, TransportError
 from pydantic import BaseModel, ValidationError
 
 from bondi.output import OutputMode
 
-from .errors import APIError, BondiError, InternalError, ServerSideValidationError
+from .errors import (
+    APIError,
+    BondiError,
+    ConnectionError,
+    InternalError,
+    ServerSideValidationError,
+)
+
+try:
+    # Faster parsing of large responses, if installed
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 if TYPE_CHECKING:
     from .client import AutologinClient
@@ -32,6 +46,15 @@ class PydanticErrorList(BaseModel):
 
 _STATUS_CODES = [200, 201, 202, 204]
 
+# Downloaded files are written by chunks
+# of this size, so they're never held in memory
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Large files are downloaded by parts concurrently,
+# if server supports range requests
+DOWNLOAD_PART_SIZE = 8 * 1024 * 1024
+DOWNLOAD_PART_WORKERS = 4
+
 
 def parse_validation_error_and_raise(json_data: dict):
 
@@ -56,10 +79,10 @@ def parse_error_and_raise(json_data: dict):
 def parse_stream_response(response: Response):
 
     if response.status_code in _STATUS_CODES:
-        return response.iter_bytes()
+        return response.iter_bytes(DOWNLOAD_CHUNK_SIZE)
 
     try:
-        json_data = response.json()
+        json_data = json_loads(response.read())
         if not isinstance(json_data, dict):
             raise ValueError()
 
@@ -69,13 +92,34 @@ def parse_stream_response(response: Response):
     parse_error_and_raise(json_data)
 
 
+def _as_is(json_data: dict):
+    return json_data
+
+
+def get_model_parser(model: Type[Any]) -> Callable[[dict], Any]:
+
+    """
+    Models with 'from_dict' classmethod are built without validation.
+    TypedDict models are returned as is. Other models are parsed with pydantic
+    """
+
+    if issubclass(model, dict):
+        return _as_is
+
+    from_dict = getattr(model, "from_dict", None)
+    if from_dict is not None:
+        return from_dict
+
+    return model.parse_obj
+
+
 def parse_response(
     response: Response,
-    model: Type[BaseModel],
+    model: Type[Any],
     grab_result: bool = True,
 ):
     try:
-        json_data = response.json()
+        json_data = json_loads(response.content)
         if not isinstance(json_data, dict):
             raise ValueError()
 
@@ -86,7 +130,7 @@ def parse_response(
         #     data = model.parse_obj(json_data["result"])
         # else:
         #     data = model.parse_obj(json_data)
-        data = model.parse_obj(json_data)
+        data = get_model_parser(model)(json_data)
 
     except ValidationError as e:
         raise InternalError() from e  # TODO: logger.debug
@@ -94,7 +138,7 @@ def parse_response(
     except ValueError as e:
         raise InternalError() from e  # TODO: logger.debug
 
-    except KeyError as e:
+    except (KeyError, TypeError) as e:
         raise InternalError() from e  # TODO: logger.debug
 
     return data
@@ -104,23 +148,60 @@ def parse_response_no_model(response: Response):
     return parse_response(response, BaseModel, False)
 
 
-def paginate(client: AutologinClient, url: str, model: Type[BaseModel]):
+def paginate(
+    client: AutologinClient,
+    url: str,
+    model: Type[Any],
+    pg_size: Optional[int] = None,
+    params: Optional[dict] = None,
+    max_pages: Optional[int] = None,
+    prefetch: bool = False,
+):
+    parse_item = get_model_parser(model)
+
+    # Extra query parameters (filters)
+    # are sent with each page request
+    params = dict(params or {})
+
+    # Larger pages -> fewer round-trips.
+    # Server decides page size, if not set
+    if pg_size is not None:
+        params["pg_size"] = pg_size
+
+    def fetch_page(page_params: dict):
+
+        response = client.get(url, params=page_params)
+
+        # Ensure no errors occurred
+        json_data = json_loads(response.content)
+        if response.status_code not in _STATUS_CODES:
+            parse_error_and_raise(json_data)
+
+        return json_data
+
+    #
+    # With prefetch, next page is requested in background
+    # while items of the current one are being processed
+    #
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    next_page: Optional[Future] = None
 
     try:
         pg_num = 0
-        while True:
+        params["pg_num"] = pg_num
 
-            # Fetch next page
-            response = client.get(url, params={"pg_num": pg_num})
+        while True:
 
-            # Ensure no errors occurred
-            json_data = response.json()
-            if response.status_code not in _STATUS_CODES:
-                parse_error_and_raise(json_data)
+            # Fetch next page or wait for prefetched one
+            if next_page is not None:
+                json_data = next_page.result()
+            else:
+                json_data = fetch_page(params)
 
             # Get page items
             items = json_data["items"]
-            pg_size = int(json_data["pg_size"])
+            is_last = False
 
             # Items must be a list
             if not isinstance(items, list):
@@ -130,25 +211,75 @@ def paginate(client: AutologinClient, url: str, model: Type[BaseModel]):
             if not items:
                 break
 
+            #
+            # If server advertises cursors, continue from the returned
+            # position, so it does not skip records of previous pages.
+            # Otherwise, request the next page by its number
+            #
+
+            if "next_cursor" in json_data:
+
+                # No cursor -> it was the last page
+                cursor = json_data["next_cursor"]
+                if cursor:
+                    params.pop("pg_num", None)
+                    params["cursor"] = cursor
+                else:
+                    is_last = True
+
+            else:
+
+                # Page not full -> next page will be empty
+                if len(items) < int(json_data["pg_size"]):
+                    is_last = True
+                else:
+                    params["pg_num"] = pg_num + 1
+
+            pg_num += 1
+
+            # Stop on limit, if set
+            if max_pages is not None and pg_num >= max_pages:
+                is_last = True
+
+            if executor is not None and not is_last:
+                next_page = executor.submit(fetch_page, dict(params))
+            else:
+                next_page = None
+
             # Yield parsed item
             for item in items:
-                yield model.parse_obj(item)
+                yield parse_item(item)
 
-            # Page not full -> next page will be empty
-            if len(items) < pg_size:
+            if is_last:
                 break
 
-            pg_num += 1
-
     except ValidationError as e:
         raise InternalError() from e  # TODO: logger.debug
 
     except ValueError as e:
         raise InternalError() from e  # TODO: logger.debug
 
-    except KeyError as e:
+    except (KeyError, TypeError) as e:
         raise InternalError() from e  # TODO: logger.debug
 
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def paginate_raw(
+    client: AutologinClient,
+    url: str,
+    pg_size: Optional[int] = None,
+    params: Optional[dict] = None,
+    max_pages: Optional[int] = None,
+    prefetch: bool = False,
+):
+    """Same as paginate, but yields items as plain dicts without validation"""
+    return paginate(client, url, dict, pg_size, params, max_pages, prefetch)
+
 
 def upload_progressbar(label: str, file: IO, length: Optional[int] = None):
     with typer.progressbar(file, length, label) as progress:
@@ -162,22 +293,107 @@ def download_progressbar(label: str, file: IO, length: Optional[int] = None):
             yield value
 
 
+def _parse_content_range(content_range: Optional[str]):
+
+    """Returns total size from 'bytes <start>-<end>/<size>' or None"""
+
+    try:
+        unit, rest = content_range.split(" ", 1)
+        if unit != "bytes":
+            return None
+        return int(rest.rsplit("/", 1)[1])
+
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+def _write_part(file: IO, offset: int, chunks: Iterator[bytes]):
+    file.seek(offset)
+    for chunk in chunks:
+        file.write(chunk)
+
+
+def _download_part(
+    url: str,
+    filepath: str,
+    start: int,
+    end: int,
+    client: AutologinClient,
+):
+    headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+    with client.stream("GET", url, headers=headers) as response:
+        if response.status_code != 206:
+            parse_stream_response(response)
+            raise InternalError()  # TODO: logger.debug
+
+        # Each part is written with its own file handle
+        with open(filepath, "r+b") as f:
+            _write_part(f, start, response.iter_bytes(DOWNLOAD_CHUNK_SIZE))
+
+    return end - start + 1
+
+
+def _remove_incomplete(filepath: str):
+
+    """
+    Preallocated file has full size even if some parts are missing.
+    It's removed, so zero-filled holes are never taken for content
+    """
+
+    with suppress(OSError):
+        os.remove(filepath)
+
+
+def _download_rest_parts(
+    label: str,
+    url: str,
+    filepath: str,
+    file_size: int,
+    client: AutologinClient,
+    output_mode: OutputMode,
+):
+    parts = [
+        (start, min(start + DOWNLOAD_PART_SIZE, file_size) - 1)
+        for start in range(DOWNLOAD_PART_SIZE, file_size, DOWNLOAD_PART_SIZE)
+    ]
+
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_PART_WORKERS) as executor:
+        futures = [
+            executor.submit(_download_part, url, filepath, start, end, client)
+            for start, end in parts
+        ]
+
+        try:
+            if output_mode == OutputMode.human:
+                with typer.progressbar(length=file_size, label=label) as progress:
+                    progress.update(DOWNLOAD_PART_SIZE)
+                    for future in as_completed(futures):
+                        progress.update(future.result())
+            else:
+                for future in as_completed(futures):
+                    future.result()
+
+        finally:
+            for future in futures:
+                future.cancel()
+
+
 def download_file(
     label: str,
     url: str,
     filepath: str,
     client: AutologinClient,
     output_mode: OutputMode,
+    by_parts: bool = False,
 ):
-    response = client.get(url)
-    stream = parse_stream_response(response)
 
-    try:
-        file_size = int(response.headers["Content-Length"])
-    except (KeyError, ValueError):
-        file_size = None
+    """
+    Downloads file streaming it to disk. With 'by_parts' the first part
+    is requested with 'Range' header. If server supports it, the rest parts
+    are downloaded concurrently. Otherwise, the whole file is streamed as usual
+    """
 
-    def streaming_download(file: IO):
+    def streaming_download(file: IO, file_size: Optional[int]):
         if output_mode == OutputMode.human:
             for chunk in download_progressbar(label, file, file_size):
                 yield chunk
@@ -185,10 +401,67 @@ def download_file(
             for chunk in file:
                 yield chunk
 
+    #
+    # Response body is read by chunks while writing to file.
+    # Client advertises every encoding it can decode (gzip, deflate,
+    # and br with 'speedups' extra), so samples are sent compressed.
+    # Parts are requested without encoding, as ranges of encoded
+    # content can't be decoded separately
+    #
+
+    headers = {}
+    if by_parts:
+        headers["Range"] = f"bytes=0-{DOWNLOAD_PART_SIZE - 1}"
+        headers["Accept-Encoding"] = "identity"
+
     try:
-        with open(filepath, "wb") as f:
-            for chunk in streaming_download(stream):
-                f.write(chunk)
+        with client.stream("GET", url, headers=headers) as response:
+
+            if response.status_code == 206:
+                content_range = response.headers.get("Content-Range")
+                file_size = _parse_content_range(content_range)
+                if file_size is None:
+                    raise InternalError()  # TODO: logger.debug
+
+                try:
+                    with open(filepath, "wb") as f:
+                        f.truncate(file_size)
+                        chunks = response.iter_bytes(DOWNLOAD_CHUNK_SIZE)
+                        _write_part(f, 0, chunks)
+                except BaseException:
+                    _remove_incomplete(filepath)
+                    raise
+
+            else:
+                stream = parse_stream_response(response)
+
+                try:
+                    file_size = int(response.headers["Content-Length"])
+                except (KeyError, ValueError):
+                    file_size = None
+
+                with open(filepath, "wb") as f:
+                    for chunk in streaming_download(stream, file_size):
+                        f.write(chunk)
+
+                return
+
+        if file_size > DOWNLOAD_PART_SIZE:
+            try:
+                _download_rest_parts(
+                    label, url, filepath, file_size, client, output_mode
+                )
+            except BaseException:
+                _remove_incomplete(filepath)
+                raise
+
+    #
+    # Body is read outside of client's 'send', so network
+    # failures during the transfer are reported here
+    #
+
+    except TransportError as e:
+        raise ConnectionError(url) from e
 
     except OSError as e:
         msg = f"Failed to open file for writing: '{filepath}'"
@@ -0,0 +1,54 @@
+import importlib
+from typing import Dict, List, Tuple
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+class LazyTyperGroup(TyperGroup):
+
+    """
+    Typer group which imports subcommand modules on demand.
+    Each subcommand is described with (module path, short help).
+    Module must expose Typer instance named 'app'
+    """
+
+    lazy_commands: Dict[str, Tuple[str, str]] = {}
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._help_only = False
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        names = set(super().list_commands(ctx))
+        return sorted(names.union(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+
+        command = super().get_command(ctx, cmd_name)
+        if command is not None or cmd_name not in self.lazy_commands:
+            return command
+
+        module_path, short_help = self.lazy_commands[cmd_name]
+
+        #
+        # Listing subcommands in help message
+        # requires only names and short help
+        #
+
+        if self._help_only:
+            return click.Command(cmd_name, short_help=short_help)
+
+        module = importlib.import_module(module_path)
+        command = typer.main.get_group(module.app)
+        self.add_command(command, cmd_name)
+
+        return command
+
+    def format_help(self, ctx: click.Context, formatter: click.HelpFormatter):
+        self._help_only = True
+        try:
+            return super().format_help(ctx, formatter)
+        finally:
+            self._help_only = False
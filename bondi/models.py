@@ -1,9 +1,13 @@
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from pydantic import AnyHttpUrl, BaseModel, Field
 
+if TYPE_CHECKING:
+    from bondi.client import AutologinClient
+
 
 class OutputMode(str, Enum):
     human = "human"
@@ -62,10 +66,20 @@ class RevisionHealth(str, Enum):
     ok = "Ok"
 
 
-class UpdateResponseModel(BaseModel):
+@dataclass
+class UpdateResponseModel:
+
+    """Built from trusted server response without validation"""
+
+    __slots__ = ("old", "new")
+
     old: dict
     new: dict
 
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(old=data["old"], new=data["new"])
+
 
 class DeleteActions(str, Enum):
     delete = "Delete"
@@ -130,3 +144,12 @@ class AppContext:
     auto_approve: bool
     silent: bool
     prompt: bool
+
+    @property
+    def client(self) -> "AutologinClient":
+
+        """Client shared by all commands. Created on first use"""
+
+        from bondi.client import get_shared_client
+
+        return get_shared_client()
@@ -1,7 +1,8 @@
 import json
 import shutil
 import textwrap
-from typing import Any, Dict, List, Tuple
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 import typer
 from pydantic import BaseModel
@@ -98,7 +99,7 @@ def wrap_headers(headers: List[Tuple[str, float]], size: int):
 def _diff_data_human(
     old: Dict[str, str],
     new: Dict[str, str],
-    columns: Dict[str, str],
+    columns: Mapping[str, str],
 ):
     name_ratio = 0.2  # 20% of terminal working space
     val_ratio = 0.4  # 2 * 40% of terminal working space
@@ -131,7 +132,7 @@ def _diff_data_json(old: Dict[str, str], new: Dict[str, str]):
 def diff_data(
     old: Dict[str, str],
     new: Dict[str, str],
-    columns: Dict[str, str],
+    columns: Mapping[str, str],
     mode: OutputMode,
 ):
     if mode == OutputMode.human:
@@ -141,14 +142,9 @@ def diff_data(
 
 
 def _list_data_human(
-    list_of_data: List[Dict[str, str]],
-    columns: List[Tuple[str, str, float]],
+    list_of_data: Iterable[Dict[str, str]],
+    columns: Sequence[Tuple[str, str, float]],
 ):
-
-    if not list_of_data:
-        success("No records. Empty")
-        return
-
     names, titles, ratios = zip(*columns)
     size = TERMINAL_WIDTH - dt_psql(len(titles))
 
@@ -161,6 +157,10 @@ def _list_data_human(
             ]
         )
 
+    if not rows:
+        success("No records. Empty")
+        return
+
     headers = wrap_headers(list(zip(titles, ratios)), size)
     typer.echo(tabulate(rows, headers=headers, tablefmt="psql"))
 
@@ -168,6 +168,8 @@ def _list_data_human(
 def _default(obj):
     if isinstance(obj, BaseModel):
         return obj.dict()
+    if isinstance(obj, datetime):
+        return obj.isoformat()
     raise TypeError()
 
 
@@ -175,21 +177,46 @@ def _dump_json(data: dict):
     typer.echo(json.dumps(data, default=_default))
 
 
+def _dump_json_list(list_of_data: Iterable[Dict[str, str]]):
+
+    """
+    Prints the same as json.dumps(list), item by item.
+    Nothing is printed until the first item is loaded. If loading
+    of later items fails, array is still closed, so output is valid JSON
+    """
+
+    items = iter(list_of_data)
+    first = next(items, None)
+
+    if first is None:
+        typer.echo("[]")
+        return
+
+    typer.echo("[", nl=False)
+    try:
+        typer.echo(json.dumps(first, default=_default), nl=False)
+        for data in items:
+            typer.echo(", ", nl=False)
+            typer.echo(json.dumps(data, default=_default), nl=False)
+    finally:
+        typer.echo("]")
+
+
 def list_data(
-    data: List[Dict[str, str]],
-    columns: List[Tuple[str, str, float]],
+    data: Iterable[Dict[str, str]],
+    columns: Sequence[Tuple[str, str, float]],
     mode: OutputMode,
 ):
 
     if mode == OutputMode.human:
         _list_data_human(data, columns)
     else:
-        _dump_json(data)
+        _dump_json_list(data)
 
 
 def _dict_data_human(
     data: Dict[str, str],
-    columns: List[Tuple[str, str]],
+    columns: Sequence[Tuple[str, str]],
     key_ratio: float = 0.2,
     val_ratio: float = 0.8,
 ):
@@ -206,7 +233,7 @@ def _dict_data_human(
 
 def dict_data(
     data: dict,
-    columns: List[Tuple[str, str]],
+    columns: Sequence[Tuple[str, str]],
     mode: OutputMode,
 ):
 
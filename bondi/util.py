@@ -1,12 +1,14 @@
+import bisect
 import functools
 import json
+import locale
 import os
 import re
 import textwrap
 import traceback
 from contextlib import suppress
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional, Sequence, Set
 
 import typer
 
@@ -19,6 +21,17 @@ APP_NAME = "bondi"
 APP_DIR = typer.get_app_dir(APP_NAME)
 LOCAL_TIMEZONE = datetime.now().astimezone().tzinfo
 
+_CREATED_DIRS: Set[str] = set()
+
+
+def ensure_dir(path: str):
+
+    """Creates directory on first write. Repeated calls do nothing"""
+
+    if path not in _CREATED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _CREATED_DIRS.add(path)
+
 
 def load_json(filepath: str):
     with open(filepath, "r", encoding="utf-8") as f:
@@ -26,6 +39,7 @@ def load_json(filepath: str):
 
 
 def save_json(filepath: str, data: object):
+    ensure_dir(os.path.dirname(filepath))
     with open(filepath, "w", encoding="utf-8") as f:
         json.dump(data, f)
 
@@ -81,14 +95,33 @@ def remove_login_result():
         os.remove(get_login_result_path())
 
 
+_IDENTIFIER_RE = re.compile(r"^\d+$")
+
+
+@functools.lru_cache(maxsize=2048)
 def is_identifier(s: str):
-    return re.match(r"^\d+$", s) is not None
+    return _IDENTIFIER_RE.match(s) is not None
 
 
 def utc_to_local(val: Optional[datetime]):
     return val.astimezone(LOCAL_TIMEZONE) if val else val
 
 
+@functools.lru_cache(maxsize=None)
+def _get_date_format():
+
+    """Expands locale's '%c' once, so it's not looked up per call"""
+
+    try:
+        return locale.nl_langinfo(locale.D_T_FMT)
+    except AttributeError:  # Not available on Windows
+        return "%c"
+
+
+def format_date(val: datetime):
+    return val.strftime(_get_date_format())
+
+
 def beautify(s: str):
     return s.capitalize().replace("_", " ")
 
@@ -97,10 +130,25 @@ def make_option(s: str):
     return "--" + s.replace("_", "-")
 
 
+# Descriptions repeat a lot in long lists
+@functools.lru_cache(maxsize=4096)
 def shorten(s: str, n: int = C_SHORTEN_DESC):
     return textwrap.shorten(s, n)
 
 
+def prefix_matches(items: Sequence[str], prefix: str):
+
+    """Returns items starting with prefix. Items must be sorted"""
+
+    result: List[str] = []
+    for i in range(bisect.bisect_left(items, prefix), len(items)):
+        if not items[i].startswith(prefix):
+            break
+        result.append(items[i])
+
+    return result
+
+
 def wrap_autocompletion_errors(func):
     @functools.wraps(func)
     def catch_exceptions(*args, **kwargs):
@@ -1,9 +1,11 @@
 import os
-from typing import Optional
+from typing import Any, Callable, Optional
 
+from click import Parameter
+from click.core import ParameterSource
 from email_validator import EmailNotValidError, validate_email
 from pydantic import AnyHttpUrl, ValidationError, parse_obj_as
-from typer import BadParameter
+from typer import BadParameter, Context
 
 
 def string(value: Optional[str]):
@@ -72,3 +74,25 @@ def positive_int(value: Optional[int]):
         raise BadParameter("Positive integer required")
 
     return value
+
+
+def skip_prompted(validation_fn: Callable[[Any], Any]):
+
+    """
+    Click validates prompted value inside prompt loop
+    and then runs the same callback again on the result.
+    Returned callback skips that second run
+    """
+
+    def callback(ctx: Context, param: Parameter, value: Any):
+        if ctx.get_parameter_source(param.name) == ParameterSource.PROMPT:
+            return value
+
+        return validation_fn(value)
+
+    return callback
+
+
+string_prompted = skip_prompted(string)
+email_prompted = skip_prompted(email)
+url_prompted = skip_prompted(url)
@@ -28,6 +28,7 @@ setup(
     url="https://github.com/Bondifuzz/bondi-python",
     description="Bondifuzz command line interface implemented in python",
     install_requires=parse_requirements("requirements-prod.txt"),
+    extras_require={"speedups": ["orjson>=3.6", "brotli", "h2>=3,<5"]},
     entry_points={"console_scripts": ["bondi=bondi.app:main"]},
     packages=find_packages(exclude=["*tests*"]),
     long_description_content_type="text/markdown",